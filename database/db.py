@@ -1,7 +1,9 @@
 from pymongo import MongoClient
 from config.settings import MONGO_URI, ADMIN_ID
+import threading
 from datetime import datetime
 from bson.objectid import ObjectId
+from cachetools import TTLCache, cached
 
 # ✅ Connect to MongoDB securely (Render-compatible)
 client = MongoClient(
@@ -17,16 +19,40 @@ users_collection = db["users"]
 participants_collection = db["participants"]
 airdrops_collection = db["airdrops"]
 
+# ✅ Unique link index: lets save_airdrop upsert in a single round-trip
+try:
+    airdrops_collection.create_index([("link", 1)], unique=True, background=True)
+except Exception as e:
+    print(f"⚠️ Could not create airdrops.link index: {e}")
+
+# ✅ user_id index: save_user / is_banned / remove_user all look users up by it
+try:
+    users_collection.create_index([("user_id", 1)], background=True)
+except Exception as e:
+    print(f"⚠️ Could not create users.user_id index: {e}")
+
+# ✅ Broadcasts fetch every user id; back-to-back airdrops reuse the list for a minute.
+# Read from worker threads (asyncio.to_thread) concurrently, so access goes through a lock
+_user_ids_cache = TTLCache(maxsize=1, ttl=60)
+_user_ids_lock = threading.Lock()
+
 # ====================== 🧑 USER FUNCTIONS ======================
 
 def save_user(user_id, username=None):
-    if not users_collection.find_one({"user_id": user_id}):
-        users_collection.insert_one({
+    # single upsert: no read-then-insert race between concurrent /start handlers
+    result = users_collection.update_one(
+        {"user_id": user_id},
+        {"$setOnInsert": {
             "user_id": user_id,
             "username": username,
             "joined_at": datetime.utcnow(),
             "banned": False
-        })
+        }},
+        upsert=True
+    )
+    if result.upserted_id is not None:
+        with _user_ids_lock:
+            _user_ids_cache.clear()
 
 def is_banned(user_id):
     user = users_collection.find_one({"user_id": user_id})
@@ -41,8 +67,16 @@ def get_total_users():
 def user_exists(user_id):
     return users_collection.find_one({"user_id": user_id}) is not None
 
+def remove_user(user_id):
+    users_collection.delete_one({"user_id": user_id})
+    with _user_ids_lock:
+        _user_ids_cache.clear()
+
+@cached(_user_ids_cache, lock=_user_ids_lock)
 def get_all_user_ids():
-    return [user["user_id"] for user in users_collection.find({}, {"user_id": 1})]
+    # a tuple: the cached value is shared by every caller, so it must not be mutable
+    cursor = users_collection.find({}, {"_id": 0, "user_id": 1}).batch_size(1000)
+    return tuple(user["user_id"] for user in cursor if "user_id" in user)
 
 get_all_users = get_all_user_ids
 count_users = get_total_users
@@ -66,17 +100,29 @@ def get_total_participants(community_id):
 # ====================== 🪂 AIRDROP FUNCTIONS ======================
 
 def save_airdrop(platform, title, link):
-    if not airdrops_collection.find_one({"link": link}):
-        airdrops_collection.insert_one({
-            "platform": platform,
-            "title": title,
-            "link": link,
-            "timestamp": datetime.utcnow(),
-            "posted": False  # Needed for /snipe
-        })
-
-def get_all_airdrop_links():
-    return {doc["link"] for doc in airdrops_collection.find({}, {"link": 1})}
+    """Insert the airdrop if its link is new. Returns True only on a real insert."""
+    now = datetime.utcnow()
+    result = airdrops_collection.update_one(
+        {"link": link},
+        {
+            "$setOnInsert": {
+                "platform": platform,
+                "title": title,
+                "link": link,
+                "timestamp": now,
+                "posted": False  # Needed for /snipe
+            },
+            "$set": {"updated_at": now}
+        },
+        upsert=True
+    )
+    return result.upserted_id is not None
+
+def get_all_airdrop_links(links=None):
+    """Stored airdrop links; pass candidate links to check a whole batch in one $in query."""
+    query = {"link": {"$in": list(links)}} if links is not None else {}
+    # _id excluded -> covered by the unique link index, no document fetch
+    return {doc["link"] for doc in airdrops_collection.find(query, {"_id": 0, "link": 1})}
 
 # ✅ Get one unposted airdrop (for snipe)
 def get_unposted_airdrop():
@@ -14,7 +14,7 @@ from handlers.airdrop_notify import router as airdrop_router
 from handlers.admin_handler import router as admin_router
 from handlers.menu_handler import router as menu_router
 from handlers import support  # support handler
-from utils.scheduler import start_scheduler
+from utils.scheduler import start_scheduler, close_scraper
 from pymongo import MongoClient
 
 # Optional: Use RedisStorage for FSM persistence (recommended for production)
@@ -181,6 +181,8 @@ def main():
         except Exception:
             logger.exception("Failed to delete webhook during shutdown")
 
+        await close_scraper()
+
         logger.info("🛑 Bot shutdown complete")
 
     app.on_startup.append(on_startup)
@@ -0,0 +1,38 @@
+"""
+Async token bucket shared by the broadcast sender (utils/task/send_airdrop.py) and the
+standalone communities crawler (utils/scrapers/zealy_api_all.py).
+"""
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket: at most `rate` acquisitions per second, bursts up to `burst`.
+    pause() holds every caller for a while, e.g. after a 429 that applies to the whole client.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.resume_at = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.resume_at:
+                    await asyncio.sleep(self.resume_at - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
@@ -27,11 +27,18 @@ if repo_root_str not in sys.path:
 # import the scraper coroutine
 try:
     # this assumes utils/scrapers/zealy.py exists and exposes run_scrape_once, test_scraper
-    from utils.scrapers.zealy import run_scrape_once, test_scraper
+    from utils.scrapers.zealy import run_scrape_once, test_scraper, close_playwright, close_telegram_session
 except Exception:
     logger.exception("Failed to import utils.scrapers.zealy. Ensure file exists and is importable.")
     raise
 
+async def run_once(limit):
+    try:
+        return await run_scrape_once(limit=limit)
+    finally:
+        await close_playwright()
+        await close_telegram_session()
+
 def get_limit():
     v = os.getenv("SCRAPE_LIMIT", "25")
     try:
@@ -47,9 +54,10 @@ if __name__ == "__main__":
 
     limit = get_limit()
     logger.info("Starting single run_scrape_once(limit=%s)", limit)
-    ok = asyncio.run(run_scrape_once(limit=limit))
-    if ok:
-        logger.info("run_scrape_once completed successfully.")
+    result = asyncio.run(run_once(limit))
+    # run_scrape_once returns the number of new drops (0 is a quiet but successful run) or False on failure
+    if result is not False:
+        logger.info("run_scrape_once completed successfully (%s new drops).", result)
         sys.exit(0)
     else:
         logger.error("run_scrape_once reported failure.")
@@ -1,11 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
 from retrying import retry
 import sqlite3
 import logging
+import threading
+import time
 import re
+import json
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
 import os
 
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional: falls back to requests' stdlib json
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -16,49 +29,168 @@ LUNAR_API_KEY = os.getenv("LUNAR_API_KEY")
 
 logging.basicConfig(filename='zkdrop_scam.log', level=logging.ERROR)
 
-conn = sqlite3.connect('zkdrop.db')
+# One pooled session for all analyzer APIs (called from worker threads; pool sized to match)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+# analyzers are called from worker threads (scheduler executor, scraper to_thread);
+# one shared connection, serialized by _db_lock
+conn = sqlite3.connect('zkdrop.db', check_same_thread=False)
+_db_lock = threading.Lock()
 conn.execute('''CREATE TABLE IF NOT EXISTS scam_checks
                 (link TEXT, contract TEXT, score INTEGER, timestamp TEXT)''')
+conn.execute('''CREATE TABLE IF NOT EXISTS scam_hosts
+                (host TEXT PRIMARY KEY, timestamp TEXT)''')
 cursor = conn.cursor()
 
+# Verdicts are cached per URL for a day. A flagged URL also bans its host for
+# SCAM_HOST_TTL (persisted in scam_hosts), except for shared platforms where one
+# bad page says nothing about the others (every scraped link is zealy.io/c/<slug>).
+SHARED_HOSTS = frozenset({
+    "zealy.io", "www.zealy.io", "twitter.com", "www.twitter.com", "x.com", "www.x.com", "t.me",
+})
+SCAM_HOST_TTL = 30 * 86400
+
+_url_scores = TTLCache(maxsize=4096, ttl=86400)
+_hosts_lock = threading.Lock()
+
+def _load_scam_hosts() -> dict:
+    """host -> ban time (epoch seconds); drops expired and shared-platform rows from the table."""
+    cutoff = datetime.fromtimestamp(time.time() - SCAM_HOST_TTL).isoformat()
+    conn.execute("DELETE FROM scam_hosts WHERE timestamp < ?", (cutoff,))
+    conn.execute(
+        f"DELETE FROM scam_hosts WHERE host IN ({','.join('?' * len(SHARED_HOSTS))})", tuple(SHARED_HOSTS)
+    )
+    conn.commit()
+    return {
+        host: datetime.fromisoformat(ts).timestamp()
+        for host, ts in conn.execute("SELECT host, timestamp FROM scam_hosts")
+    }
+
+_scam_hosts = _load_scam_hosts()
+
+def _json(response):
+    return orjson.loads(response.content) if orjson is not None else response.json()
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+SAFE_BROWSING_URL = "https://safebrowsing.googleapis.com/v4/threatMatches:find"
+# constant part of every threatMatches:find body; only threatEntries changes per call
+_SB_BODY_TEMPLATE = {
+    "client": {"clientId": "zkDrop", "clientVersion": "1.0"},
+    "threatInfo": {
+        "threatTypes": ["MALWARE", "SOCIAL_ENGINEERING"],
+        "platformTypes": ["ANY_PLATFORM"],
+        "threatEntryTypes": ["URL"],
+    },
+}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _safe_browsing_matches(urls) -> set:
+    """POST one threatMatches:find for urls and return the ones Safe Browsing flagged."""
+    body = {
+        **_SB_BODY_TEMPLATE,
+        "threatInfo": {**_SB_BODY_TEMPLATE["threatInfo"], "threatEntries": [{"url": u} for u in urls]},
+    }
+    response = SESSION.post(
+        SAFE_BROWSING_URL, params={"key": SAFE_BROWSING_KEY}, data=_dumps(body), headers=_JSON_HEADERS
+    )
+    response.raise_for_status()
+    return {m["threat"]["url"] for m in _json(response).get("matches", [])}
+
+@lru_cache(maxsize=4096)
+def _host(url: str) -> str:
+    # the same links are re-checked every cycle; skip re-parsing them
+    return urlparse(url).netloc.lower()
+
+def _host_banned(host: str) -> bool:
+    # caller holds _hosts_lock
+    banned_at = _scam_hosts.get(host)
+    return banned_at is not None and time.time() - banned_at < SCAM_HOST_TTL
+
+def _cached_score(url: str):
+    """Cached Safe Browsing score for url (30 if its host is banned), else None."""
+    host = _host(url)
+    with _hosts_lock:
+        if host and _host_banned(host):
+            return 30
+        return _url_scores.get(url)
+
+def _ban_host(host: str):
+    if not host or host in SHARED_HOSTS:
+        return
+    now = datetime.now()
+    with _hosts_lock:
+        if _host_banned(host):
+            return
+        _scam_hosts[host] = now.timestamp()
+    with _db_lock:
+        cursor.execute("INSERT OR REPLACE INTO scam_hosts VALUES (?, ?)", (host, now.isoformat()))
+        conn.commit()
+
 @retry(stop_max_attempt_number=3, wait_fixed=3000)
 def check_safe_browsing(url: str) -> int:
+    cached = _cached_score(url)
+    if cached is not None:
+        return cached
     try:
-        response = requests.post(
-            "https://safebrowsing.googleapis.com/v4/threatMatches:find",
-            params={"key": SAFE_BROWSING_KEY},
-            json={
-                "client": {"clientId": "zkDrop", "clientVersion": "1.0"},
-                "threatInfo": {
-                    "threatTypes": ["MALWARE", "SOCIAL_ENGINEERING"],
-                    "platformTypes": ["ANY_PLATFORM"],
-                    "threatEntryTypes": ["URL"],
-                    "threatEntries": [{"url": url}]
-                }
-            }
-        )
-        response.raise_for_status()
-        return 30 if response.json().get("matches") else 0
+        score = 30 if _safe_browsing_matches([url]) else 0
+        with _hosts_lock:
+            _url_scores[url] = score
+        if score:
+            _ban_host(_host(url))
+        return score
     except Exception as e:
         logging.error(f"Safe Browsing failed: {e}")
         scam_patterns = r"(metaamask|uniswop|claimnow|walletconnect|drainwallet)"
         return 20 if re.search(scam_patterns, url.lower()) else 0
 
+SAFE_BROWSING_BATCH = 500  # threatEntries limit per threatMatches:find request
+
+def check_scam_batch(links: list) -> set:
+    """
+    Look up many links with one Safe Browsing request per 500 and return the flagged ones.
+    Verdicts are cached per URL (the cache check_safe_browsing reads, so later per-link checks
+    skip the API); a batch match never bans the link's host.
+    """
+    flagged = set()
+    pending = []
+    for link in links:
+        cached = _cached_score(link)
+        if cached:
+            flagged.add(link)
+        elif cached is None:
+            pending.append(link)
+
+    for i in range(0, len(pending), SAFE_BROWSING_BATCH):
+        chunk = pending[i:i + SAFE_BROWSING_BATCH]
+        try:
+            matches = _safe_browsing_matches(chunk)
+        except Exception as e:
+            logging.error(f"Safe Browsing batch failed: {e}")
+            continue
+        flagged |= matches
+        with _hosts_lock:
+            for link in chunk:
+                _url_scores[link] = 30 if link in matches else 0
+    return flagged
+
 @retry(stop_max_attempt_number=3, wait_fixed=3000)
 def check_contract(address: str) -> int:
     score = 0
     try:
-        r = requests.get(
+        r = SESSION.get(
             f"https://api.etherscan.io/api?module=contract&action=getsourcecode&address={address}&apikey={ETHERSCAN_API_KEY}"
         )
-        data = r.json()["result"][0]
+        data = _json(r)["result"][0]
         if not data["SourceCode"]:
             score += 15
 
-        r = requests.get(
+        r = SESSION.get(
             f"https://api.etherscan.io/api?module=account&action=txlist&address={address}&startblock=0&endblock=99999999&page=1&offset=1&sort=asc&apikey={ETHERSCAN_API_KEY}"
         )
-        txs = r.json().get("result", [])
+        txs = _json(r).get("result", [])
         if txs:
             creation_time = int(txs[0]["timeStamp"])
             days_old = (datetime.now().timestamp() - creation_time) / (3600 * 24)
@@ -74,10 +206,10 @@ def check_contract(address: str) -> int:
 def check_domain_age(url: str) -> int:
     try:
         domain = re.findall(r"https?://([^/]+)", url)[0]
-        response = requests.get(
+        response = SESSION.get(
             f"https://www.whoisxmlapi.com/whoisserver/WhoisService?apiKey={WHOIS_API_KEY}&domainName={domain}&outputFormat=JSON"
         )
-        data = response.json()
+        data = _json(response)
         created = data["WhoisRecord"].get("createdDate")
         if created:
             created_date = datetime.strptime(created.split("T")[0], "%Y-%m-%d")
@@ -91,10 +223,10 @@ def check_domain_age(url: str) -> int:
 @retry(stop_max_attempt_number=3, wait_fixed=3000)
 def check_social_sentiment(token_symbol: str) -> int:
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"https://api.lunarcrush.com/v2?data=assets&key={LUNAR_API_KEY}&symbol={token_symbol}"
         )
-        data = response.json()
+        data = _json(response)
         if not data.get("data"):
             return 10
         sentiment = data["data"][0].get("alt_rank", 100)
@@ -109,7 +241,8 @@ def check_social_sentiment(token_symbol: str) -> int:
 
 def analyze_airdrop(link: str, contract: str = None, token_symbol: str = None) -> int:
     try:
-        cached = cursor.execute("SELECT score FROM scam_checks WHERE link=? AND contract=?", (link, contract)).fetchone()
+        with _db_lock:
+            cached = cursor.execute("SELECT score FROM scam_checks WHERE link=? AND contract=?", (link, contract)).fetchone()
         if cached:
             return cached[0]
 
@@ -123,8 +256,9 @@ def analyze_airdrop(link: str, contract: str = None, token_symbol: str = None) -
         if token_symbol:
             score += check_social_sentiment(token_symbol)
 
-        cursor.execute("INSERT INTO scam_checks VALUES (?, ?, ?, ?)", (link, contract, score, datetime.now().isoformat()))
-        conn.commit()
+        with _db_lock:
+            cursor.execute("INSERT INTO scam_checks VALUES (?, ?, ?, ?)", (link, contract, score, datetime.now().isoformat()))
+            conn.commit()
 
         return score
     except Exception as e:
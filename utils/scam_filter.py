@@ -13,18 +13,12 @@ SCAM_DOMAINS = [
     r"(metaamask|uniswop|airdropscam|airdrop\-free|claimnow|walletdrain)"
 ]
 
+# ⚡ Compiled once: one case-insensitive pass per check, no lowercased copy of the text
+SCAM_KEYWORDS_RE = re.compile("|".join(map(re.escape, SCAM_KEYWORDS)), re.IGNORECASE)
+SCAM_DOMAINS_RE = re.compile("|".join(SCAM_DOMAINS), re.IGNORECASE)
+
 # ✅ Main scam check function expected by the bot
 def is_scam(content: str) -> bool:
-    text = content.lower()
-
-    for keyword in SCAM_KEYWORDS:
-        if keyword in text:
-            return True
-
-    for pattern in SCAM_DOMAINS:
-        if re.search(pattern, text):
-            return True
-
-    return False
+    return bool(SCAM_KEYWORDS_RE.search(content) or SCAM_DOMAINS_RE.search(content))
 #this bot deploynwnt eh
 basic_scam_check = is_scam
@@ -3,7 +3,7 @@ import os
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, List
+from typing import Any, Optional, Union
 
 import aiohttp
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -20,9 +20,29 @@ try:
 except Exception:
     zealy_scraper = None
 
+try:
+    import aiodns  # noqa: F401  (backs aiohttp's AsyncResolver)
+    from aiohttp.resolver import AsyncResolver
+except Exception:
+    AsyncResolver = None  # optional: aiohttp resolves through getaddrinfo in its thread pool
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
+# Shared session for the scheduler's own HTTP calls (keep-alive ping): reused across
+# job runs instead of a new connector + TLS handshake every time
+_http_session: aiohttp.ClientSession = None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        resolver = AsyncResolver() if AsyncResolver is not None else None
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=75, resolver=resolver),
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
+    return _http_session
+
 # ---------- Format Messages ----------
 def format_user_message(airdrop: dict) -> str:
     title = airdrop.get("title", "Unknown")
@@ -72,16 +92,43 @@ def format_admin_daily_report(digest_message: str, sent_count: int) -> str:
     )
 
 # ---------- Scraper wrapper used by scheduler ----------
-async def run_scraper_once(limit=25) -> List[dict]:
+# live (60s), interval and daily jobs all scrape the same source; a run already in flight
+# is shared instead of starting a second one against the same API/browser
+_scrape_task: Optional[asyncio.Task] = None
+_scrape_limit = 0
+
+async def run_scraper_once(limit=25) -> Union[int, bool]:
+    """
+    Run the scraper once, or join the run already in progress if it covers at least `limit`.
+    A run with a smaller limit is waited out first, so two scrapes never overlap.
+    Waiters are shielded, so a cancelled job doesn't cancel the run for the others.
+    """
+    global _scrape_task, _scrape_limit
+    while _scrape_task is not None and not _scrape_task.done():
+        task = _scrape_task
+        if _scrape_limit >= limit:
+            logger.debug(f"Joining in-flight scrape (limit={_scrape_limit})")
+            return await asyncio.shield(task)
+        logger.debug(f"Waiting for in-flight scrape (limit={_scrape_limit}) before running limit={limit}")
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            pass
+    _scrape_task = asyncio.create_task(_run_scraper(limit))
+    _scrape_limit = limit
+    return await asyncio.shield(_scrape_task)
+
+async def _run_scraper(limit=25) -> Union[int, bool]:
     """
     Call the scraper's single-run function. The zealy scraper in this repo exposes
     run_scrape_once(limit=...) — check for that first. Fall back to run_once/scrape_once
     if present. If only a continuous run_loop exists, do NOT call it from here (it would block).
-    Returns whatever the scraper returns (or [] if none).
+    Returns what the scraper returns (run_scrape_once: drops broadcast, False on failure),
+    0 if there was nothing to run, False if it raised.
     """
     if not zealy_scraper:
         logger.warning("No Zealy scraper module found.")
-        return []
+        return 0
 
     fn = (
         getattr(zealy_scraper, "run_scrape_once", None)
@@ -95,7 +142,7 @@ async def run_scraper_once(limit=25) -> List[dict]:
             logger.debug("Zealy scraper exposes run_loop (continuous). Scheduler run_scraper_once will skip calling run_loop.")
         else:
             logger.debug("No usable run-once function found on zealy_scraper.")
-        return []
+        return 0
 
     try:
         if asyncio.iscoroutinefunction(fn):
@@ -104,7 +151,25 @@ async def run_scraper_once(limit=25) -> List[dict]:
         return await loop.run_in_executor(None, lambda: fn(limit=limit))
     except Exception as e:
         logger.exception("Error when running scraper function from scheduler")
-        return []
+        return False
+
+async def close_scraper():
+    """Release long-lived scraper resources (shared Playwright browser, HTTP sessions). Safe to call at shutdown."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        try:
+            await _http_session.close()
+        except Exception:
+            logger.exception("Error while closing scheduler HTTP session")
+    _http_session = None
+    for name in ("close_playwright", "close_telegram_session"):
+        close_fn = getattr(zealy_scraper, name, None) if zealy_scraper else None
+        if not close_fn:
+            continue
+        try:
+            await close_fn()
+        except Exception:
+            logger.exception("Error while closing scraper resources (%s)", name)
 
 # ---------- Process DB & broadcast ----------
 async def process_unposted(bot: Any, max_items=5):
@@ -174,9 +239,8 @@ def start_scheduler(bot: Any):
     async def keep_alive():
         url = os.getenv("UPTIME_URL", "https://zkdrop-bot.onrender.com/uptime")
         try:
-            async with aiohttp.ClientSession() as s:
-                async with s.get(url, timeout=10) as r:
-                    logger.debug(f"Keep-alive {r.status}")
+            async with _get_http_session().get(url, timeout=aiohttp.ClientTimeout(total=10)) as r:
+                logger.debug(f"Keep-alive {r.status}")
         except Exception as e:
             logger.debug(f"Keep-alive error {e}")
 
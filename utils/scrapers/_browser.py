@@ -0,0 +1,105 @@
+"""
+Shared headless Chromium for the standalone browser scrapers.
+
+zealy_debug.py, zealy_api_via_browser.py and zealy_api_via_browser_all.py used to
+launch their own Chromium each; get_browser() launches it once per event loop and
+hands the same instance to every caller. Callers open (and close) their own
+contexts (browser_context()); close_browser() tears the browser down at the end of the process.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+from playwright.async_api import Browser, async_playwright
+
+LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+
+# the API scrapers only need the page's origin to fetch from; none of this is used
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+_lock = asyncio.Lock()
+_pw = _browser = None
+_loop = None
+
+
+async def _teardown(pw, browser):
+    if browser is not None:
+        try:
+            await browser.close()
+        except Exception:
+            pass
+    if pw is not None:
+        try:
+            await pw.stop()
+        except Exception:
+            pass
+
+
+async def get_browser() -> Browser:
+    """Return the shared browser, launching it on first use (or if it disconnected)."""
+    global _pw, _browser, _loop
+    loop = asyncio.get_running_loop()
+    async with _lock:
+        if _browser is not None and _loop is loop and _browser.is_connected():
+            return _browser
+        old_pw, old_browser, old_loop = _pw, _browser, _loop
+        _pw = _browser = _loop = None
+        if old_pw is not None and old_loop is not loop:
+            # the driver's pipes belong to the loop that started it: close it there, or
+            # refuse rather than leak a Chromium + driver per loop
+            if old_loop is None or not old_loop.is_running():
+                raise RuntimeError(
+                    "shared browser was left open by a finished event loop; "
+                    "use run_and_close() / close_browser() before the loop ends"
+                )
+            asyncio.run_coroutine_threadsafe(_teardown(old_pw, old_browser), old_loop)
+        elif old_pw is not None:
+            await _teardown(old_pw, old_browser)  # disconnected: stop its driver too
+        _pw = await async_playwright().start()
+        try:
+            _browser = await _pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        except Exception:
+            await _pw.stop()
+            _pw = _browser = None
+            raise
+        _loop = loop
+        return _browser
+
+
+async def _block_heavy(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def browser_context(block_resources: bool = False, **kwargs):
+    """
+    A fresh context on the shared browser; only the context is closed on exit.
+    block_resources aborts images/fonts/CSS/media for callers that never render the page.
+    """
+    context = await (await get_browser()).new_context(**kwargs)
+    if block_resources:
+        await context.route("**/*", _block_heavy)
+    try:
+        yield context
+    finally:
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+
+async def close_browser():
+    global _pw, _browser, _loop
+    async with _lock:
+        await _teardown(_pw, _browser)
+        _pw = _browser = _loop = None
+
+
+async def run_and_close(coro):
+    """Script entry point: run coro, then shut the shared browser down."""
+    try:
+        return await coro
+    finally:
+        await close_browser()
@@ -0,0 +1,198 @@
+"""
+Shared helpers for the Zealy communities API scrapers.
+
+zealy_api_all.py, zealy_api_via_browser.py, zealy_api_via_browser_all.py and
+zealy.py all page the same endpoint and unpack the same response shape (and
+zealy.py / zealy_debug.py read the same explore-page anchors); the common
+pieces live here so they are defined (and fixed) once.
+"""
+import json
+import random
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional: falls back to stdlib json (the zealy-api workflow installs requests only)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # optional: raw dumps are written as plain JSON without it
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None  # optional: callers fall back to reading anchors through Playwright handles
+
+LXML_AVAILABLE = etree is not None
+
+API_BASE = "https://api-v1.zealy.io/communities"
+EXPLORE_URL = "https://zealy.io/explore"
+
+# page.evaluate() body: fetch a URL from the page context so the request carries
+# the browser's headers/origin (the API 403s plain clients)
+BROWSER_FETCH_JS = """async (url) => {
+    try {
+        const res = await fetch(url, { method: 'GET', credentials: 'omit', headers: { 'Accept': 'application/json, text/plain, */*' } });
+        const status = res.status;
+        let json = null;
+        try { json = await res.json(); } catch(e) { json = null; }
+        return { status, json };
+    } catch (err) {
+        return { error: String(err) };
+    }
+}"""
+
+# page.evaluate() body: fetch a window of API pages concurrently in one CDP round-trip;
+# takes {api, base, count, limit} and returns one BROWSER_FETCH_JS-shaped result per page
+BROWSER_FETCH_WINDOW_JS = """async ({ api, base, count, limit }) => {
+    const urls = Array.from({ length: count }, (_, i) => `${api}?category=all&page=${base + i}&limit=${limit}`);
+    return Promise.all(urls.map(async (url) => {
+        try {
+            const res = await fetch(url, { method: 'GET', credentials: 'omit', headers: { 'Accept': 'application/json, text/plain, */*' } });
+            const status = res.status;
+            const retryAfter = res.headers.get('Retry-After');
+            let json = null;
+            try { json = await res.json(); } catch(e) { json = null; }
+            return { status, json, retryAfter };
+        } catch (err) {
+            return { error: String(err) };
+        }
+    }));
+}"""
+
+
+# page.eval_on_selector_all() body for "a[href*='/c/']": the first `max` (href, text) pairs
+# in one CDP round-trip (the no-lxml path; a handle per anchor cost two round-trips each)
+ANCHORS_JS = "(els, max) => els.slice(0, max).map(a => [a.getAttribute('href'), a.textContent])"
+COMMUNITY_ANCHOR_SELECTOR = "a[href*='/c/']"
+
+# upper bound on anchors read off one explore page, whatever its size (each card links
+# its community a few times, so this is several times any discovery limit)
+MAX_ANCHORS = 500
+
+
+def loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_json(path: str, obj: Any) -> None:
+    """Write obj as indented UTF-8 JSON; orjson serializes straight to bytes when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def write_raw_json(path: str, obj: Any) -> str:
+    """
+    Write a (potentially large) raw dump as zstd-compressed JSON at path + ".zst" when
+    zstandard is installed (read with `zstd -dc file | jq`), else as plain JSON at path.
+    Returns the path actually written.
+    """
+    if zstandard is None:
+        write_json(path, obj)
+        return path
+    data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS) if orjson is not None else json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    out = path + ".zst"
+    with open(out, "wb") as f:
+        f.write(zstandard.ZstdCompressor(level=3, threads=-1).compress(data))
+    return out
+
+
+# transient failures worth retrying a page for: rate limits and gateway/server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_ATTEMPTS = 3
+
+
+def backoff_delay(attempt: int, retry_after: Any = None, base: float = 0.5, cap: float = 8.0) -> float:
+    """Seconds to wait before retry `attempt`: the server's Retry-After if it sent one, else full-jitter exponential."""
+    try:
+        if retry_after is not None:
+            return min(float(retry_after), 60.0)
+    except (TypeError, ValueError):
+        pass  # HTTP-date form: fall through to jitter
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def page_url(page: int, limit: int) -> str:
+    return f"{API_BASE}?category=all&page={page}&limit={limit}"
+
+
+# wrapper keys the API has used for the community list, in lookup order
+ITEM_KEYS = ("data", "communities", "items", "results")
+
+
+def find_items(obj: Any, keys: Tuple[str, ...] = ITEM_KEYS) -> List:
+    """Return the community list from an API page (bare list or wrapped under one of `keys`)."""
+    if isinstance(obj, list):
+        return obj
+    if isinstance(obj, dict):
+        for key in keys:
+            if key in obj and isinstance(obj[key], list):
+                return obj[key]
+        # fallback: first list value
+        for v in obj.values():
+            if isinstance(v, list):
+                return v
+    return []
+
+
+def iter_compact(items: Iterable) -> Iterator[Dict]:
+    """Yield the compact {slug, title, href} record for each raw API item in one pass."""
+    for it in items:
+        if not isinstance(it, dict):
+            yield {"slug": None, "title": None, "href": None}
+            continue
+        slug = it.get("slug") or it.get("handle") or it.get("id") or it.get("community_id")
+        title = it.get("title") or it.get("name") or it.get("displayName") or it.get("label")
+        href = it.get("href") or it.get("url") or (f"/c/{slug}" if slug else None)
+        yield {"slug": slug, "title": title, "href": href}
+
+
+class _AnchorTarget:
+    """lxml parser target that keeps only /c/ anchors; no tree is built for anything else."""
+
+    def __init__(self):
+        self.found: List[Tuple[str, str]] = []
+        self._href = None
+        self._text: List[str] = []
+
+    def start(self, tag, attrib):
+        if tag == "a":
+            href = attrib.get("href")
+            if href and "/c/" in href:
+                self._href, self._text = href, []
+
+    def data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def end(self, tag):
+        if tag == "a" and self._href is not None:
+            self.found.append((self._href, "".join(self._text)))
+            self._href = None
+
+    def close(self):
+        return None
+
+
+def iter_community_anchors(html_text: str, chunk_size: int = 16384) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (href, text) for /c/ anchors while feeding the page to lxml in chunks, so the
+    caller can stop as soon as it has enough and the rest of the page is never parsed.
+    The parser drives a target instead of building a tree, so the non-anchor markup is
+    never materialized at all. Requires lxml (LXML_AVAILABLE).
+    """
+    target = _AnchorTarget()
+    parser = etree.HTMLParser(target=target)
+    for i in range(0, len(html_text), chunk_size):
+        parser.feed(html_text[i:i + chunk_size])
+        if target.found:
+            yield from target.found
+            target.found = []
+    parser.close()
+    yield from target.found
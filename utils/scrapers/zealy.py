@@ -20,10 +20,43 @@ import aiohttp
 import json
 import time
 import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from pymongo import MongoClient
+from cachetools import TTLCache
+from pymongo import MongoClient, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, OperationFailure
+
+try:
+    from utils.scrapers._zealy_core import (
+        ANCHORS_JS, API_BASE, BROWSER_FETCH_JS, COMMUNITY_ANCHOR_SELECTOR, LXML_AVAILABLE, MAX_ANCHORS, RETRY_ATTEMPTS,
+        RETRY_STATUSES, backoff_delay, find_items, iter_community_anchors, page_url,
+    )
+except ImportError:  # run as a script: utils/scrapers is on sys.path
+    from _zealy_core import (
+        ANCHORS_JS, API_BASE, BROWSER_FETCH_JS, COMMUNITY_ANCHOR_SELECTOR, LXML_AVAILABLE, MAX_ANCHORS, RETRY_ATTEMPTS,
+        RETRY_STATUSES, backoff_delay, find_items, iter_community_anchors, page_url,
+    )
+
+try:
+    import orjson
+except Exception:
+    orjson = None  # optional: falls back to stdlib json
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except Exception:
+    ijson = None  # optional: large API pages are parsed in one go
+
+try:
+    import aiodns  # noqa: F401  (backs aiohttp's AsyncResolver)
+    from aiohttp.resolver import AsyncResolver
+except Exception:
+    AsyncResolver = None  # optional: aiohttp resolves through getaddrinfo in its thread pool
 
 # ---------------------- Logging ----------------------
 logging.basicConfig(
@@ -45,7 +78,6 @@ except Exception:
     logger.debug("python-dotenv not installed or .env missing; using system environment")
 
 BASE_URL = "https://zealy.io"
-API_BASE = "https://api-v1.zealy.io/communities"
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -63,72 +95,186 @@ ADMIN_ID = os.getenv("ADMIN_ID")
 # Optional configuration
 OWNER_USERNAME = os.getenv("OWNER_USERNAME", "VickOnWeb3")
 POLL_INTERVAL = int(os.getenv("ZEALY_POLL_INTERVAL", "300"))  # seconds (default 5 min)
+POLL_INTERVAL_MAX = int(os.getenv("ZEALY_POLL_INTERVAL_MAX", str(POLL_INTERVAL * 8)))  # backoff cap on idle cycles
 DAILY_HOUR_UTC = int(os.getenv("ZEALY_DAILY_HOUR_UTC", "9"))  # default 09:00 UTC
 COMPACT_JSON_PATH = os.getenv("ZEALY_COMPACT_JSON", "zealy_browser_api_all_compact.json")
 PAGE_LIMIT = int(os.getenv("ZEALY_PAGE_LIMIT", "30"))
 MAX_PAGES = int(os.getenv("ZEALY_MAX_PAGES", "200"))
+QUEST_PAGE_POOL = int(os.getenv("ZEALY_QUEST_PAGES", "4"))  # concurrent Playwright pages for quest fetching
+CONTEXT_RECYCLE_PAGES = int(os.getenv("ZEALY_CONTEXT_RECYCLE_PAGES", "20"))  # fresh browser context after this many pages
+ANALYZE_CONCURRENCY = int(os.getenv("ZEALY_ANALYZE_CONCURRENCY", "20"))  # parallel scam/buzz lookups per cycle
+BROADCAST_CONCURRENCY = int(os.getenv("ZEALY_BROADCAST_CONCURRENCY", "5"))  # parallel community broadcasts per cycle
+DISCOVERY_CACHE_SECONDS = int(os.getenv("ZEALY_DISCOVERY_CACHE_SECONDS", "120"))  # share a discovery across overlapping jobs/workers; 0 disables
 
 # ---------------------- MongoDB Setup ----------------------
-try:
-    mongo_client = MongoClient(
-        MONGO_URI,
-        tls=True,
-        tlsAllowInvalidCertificates=False,
-        serverSelectionTimeoutMS=5000,
-        connectTimeoutMS=10000,
-        socketTimeoutMS=30000,
-        retryWrites=True,
-        retryReads=True
-    )
-    mongo_client.admin.command('ping')
-    logger.info("Successfully connected to MongoDB")
+@lru_cache(maxsize=1)
+def get_db():
+    """
+    Connect on first use rather than at import, so importing this module (e.g. for
+    close_playwright) doesn't pay the TLS handshake + server discovery up front.
+    """
+    try:
+        mongo_client = MongoClient(
+            MONGO_URI,
+            tls=True,
+            tlsAllowInvalidCertificates=False,
+            serverSelectionTimeoutMS=5000,
+            connectTimeoutMS=10000,
+            socketTimeoutMS=30000,
+            retryWrites=True,
+            retryReads=True,
+            maxPoolSize=50,
+            minPoolSize=5,
+            compressors="zstd,zlib"  # zstd when the zstandard package is installed, zlib otherwise
+        )
+        mongo_client.admin.command('ping')
+        logger.info("Successfully connected to MongoDB")
+    except Exception as e:
+        logger.critical(f"MongoDB connection failed: {str(e)}")
+        raise
 
     db = mongo_client.get_database("zkdrop_bot")
+    _ensure_indexes(db)
+    return db
+
+def get_airdrops_col():
+    return get_db().get_collection("airdrops")
+
+def get_sent_log_col():
+    return get_db().get_collection("sent_log")
+
+def get_users_col():
+    return get_db().get_collection("users")
+
+def get_discovery_cache_col():
+    return get_db().get_collection("discovery_cache")
+
+SENT_LOG_TTL_SECONDS = 7 * 86400  # sent_log entries auto-expire after a week
+
+# airdrops not seen on Zealy for this long are evicted by Mongo (still-listed ones keep getting touched)
+AIRDROP_TTL_SECONDS = int(os.getenv("ZEALY_AIRDROP_TTL_HOURS", "72")) * 3600
+TRENDING_INDEX = "trending_idx"
+# fields send_daily_trending actually reads
+TRENDING_PROJECTION = {"_id": 0, "title": 1, "link": 1, "xp": 1, "rank_score": 1, "scam_verdict": 1}
+
+def _ensure_indexes(db):
+    """Create the indexes the hot-path lookups rely on (idempotent, non-fatal)."""
     airdrops_col = db.get_collection("airdrops")
     sent_log_col = db.get_collection("sent_log")
     users_col = db.get_collection("users")
-
-except Exception as e:
-    logger.critical(f"MongoDB connection failed: {str(e)}")
-    raise
+    specs = [
+        (airdrops_col, "link", {"unique": True}),
+        (airdrops_col, [("processed", 1), ("created_at", -1), ("rank_score", -1)], {"name": TRENDING_INDEX}),
+        # TTL must be single-field, so it sits beside the trending index
+        (airdrops_col, "last_seen", {"expireAfterSeconds": AIRDROP_TTL_SECONDS, "name": "ttl_last_seen"}),
+        (sent_log_col, [("link", 1), ("sent_at", -1)], {}),
+        (sent_log_col, "sent_at", {"expireAfterSeconds": SENT_LOG_TTL_SECONDS}),
+        # sparse: users saved by the bot handlers only carry user_id
+        (users_col, "chat_id", {"unique": True, "sparse": True}),
+    ]
+    for col, keys, opts in specs:
+        try:
+            col.create_index(keys, **opts)
+        except Exception as e:
+            logger.warning(f"Index creation failed on {col.name} {keys} (lookups will still work, just slower): {e}")
+    # superseded by trending_idx; every airdrop write paid to maintain it on existing deployments
+    try:
+        airdrops_col.drop_index("created_at_-1_rank_score_-1")
+    except OperationFailure:
+        pass  # already gone
+    except Exception as e:
+        logger.debug(f"Could not drop superseded airdrops index: {e}")
 
 # ---------------------- Utility helpers ----------------------
 def now_utc():
-    return datetime.utcnow()
+    # naive UTC, matching what pymongo hands back for stored dates (utcnow() is deprecated)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def _write_json(path: str, obj: Any):
+    """
+    Write obj as indented UTF-8 JSON (orjson when available).
+    Written to a temp file then os.replace()d, so readers never see a partial file.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        if orjson is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(obj, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def build_zealy_url(slug: str) -> str:
     return f"{BASE_URL}/c/{slug}"
 
-def _compact_item_from_api(it: Dict[str, Any]) -> Dict[str, Any]:
-    # API uses id and name; other shapes possible. Normalize to slug/title/href
+def _compact_item_from_api(it: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    # API uses id and name; other shapes possible. Normalize to (slug, title, href);
+    # a plain tuple since _normalize_communities unpacks it straight into its own record
     slug = it.get("id") or it.get("subdomain") or it.get("slug")
     title = it.get("name") or it.get("title") or it.get("label") or it.get("displayName")
     href = f"/c/{slug}" if slug else it.get("href") or it.get("url")
-    return {
-        "slug": slug,
-        "title": title,
-        "href": href,
-        "raw": it
-    }
+    return slug, title, href
+
+# slug -> last time it was handled (saved or confirmed already in DB); lets steady-state
+# poll cycles skip known communities without normalizing them or querying Mongo.
+# Timestamps are time.monotonic(): only ever compared in-process, immune to clock steps.
+RECENT_SLUG_TTL = 24 * 3600
+_recent_slugs: Dict[str, float] = {}
 
-def is_duplicate(link):
+def _mark_recent(slug: str):
+    if slug:
+        _recent_slugs[slug] = time.monotonic()
+
+def _is_recent(slug: str, now: Optional[float] = None) -> bool:
+    ts = _recent_slugs.get(slug)
+    return ts is not None and (now or time.monotonic()) - ts < RECENT_SLUG_TTL
+
+def _prune_recent():
+    cutoff = time.monotonic() - RECENT_SLUG_TTL
+    for slug in [k for k, ts in _recent_slugs.items() if ts < cutoff]:
+        del _recent_slugs[slug]
+
+def known_links(links, hours=24) -> Optional[set]:
+    """
+    Links already stored or broadcast in the last `hours`: one $in query per collection
+    for the whole cycle, or None if the lookup failed. Only used to skip re-analysing known
+    communities; duplicate inserts themselves are prevented by the unique link index
+    (upserts in save_airdrop_records).
+    """
+    links = [l for l in links if l]
+    if not links:
+        return set()
     try:
-        return airdrops_col.find_one({"link": link}) is not None
+        cutoff = now_utc() - timedelta(hours=hours)
+        known = {d["link"] for d in get_airdrops_col().find({"link": {"$in": links}}, {"_id": 0, "link": 1})}
+        known.update(
+            d["link"] for d in get_sent_log_col().find({"link": {"$in": links}, "sent_at": {"$gte": cutoff}}, {"_id": 0, "link": 1})
+        )
+        return known
     except Exception as e:
-        logger.error(f"Duplicate check failed: {e}")
-        return True  # fail-safe
+        logger.error(f"Batched duplicate check failed: {e}")
+        return None
 
-def was_sent_recently(link, hours=24):
+def touch_last_seen(links):
+    """Refresh last_seen on already-stored airdrops (one round-trip) so the TTL index keeps them."""
+    links = [l for l in links if l]
+    if not links:
+        return
     try:
-        cutoff = now_utc() - timedelta(hours=hours)
-        return sent_log_col.find_one({"link": link, "sent_at": {"$gte": cutoff}}) is not None
+        get_airdrops_col().update_many({"link": {"$in": links}}, {"$set": {"last_seen": now_utc()}})
     except Exception as e:
-        logger.error(f"Sent recently check failed: {e}")
-        return True  # fail-safe
+        logger.error(f"Failed to refresh last_seen: {e}")
 
 def log_sent(link):
     try:
-        sent_log_col.insert_one({
+        get_sent_log_col().insert_one({
             "link": link,
             "sent_at": now_utc(),
             "processed": False
@@ -136,29 +282,66 @@ def log_sent(link):
     except Exception as e:
         logger.error(f"Failed to log sent message: {e}")
 
-def save_airdrop_record(title, url, source, rank_score, twitter, xp_display, sample_desc):
+def airdrop_upsert(title, url, source, rank_score, twitter, xp_display, sample_desc,
+                   scam_summary=None, twitter_score=None) -> UpdateOne:
+    """
+    Idempotent write for one airdrop, keyed on link: inserts the full record once,
+    afterwards only refreshes last_seen. Scores are stored with the record so the
+    daily digest never has to recompute them.
+    """
+    scam_summary = scam_summary or {}
+    now = now_utc()
+    return UpdateOne(
+        {"link": url},
+        {
+            "$setOnInsert": {
+                "title": title,
+                "source": source,
+                "rank_score": rank_score,
+                "twitter": twitter,
+                "xp": xp_display,
+                "description": sample_desc,
+                "scam_verdict": scam_summary.get("verdict"),
+                "scam_score": scam_summary.get("scam_score"),
+                "twitter_score": twitter_score,
+                "created_at": now,
+                "processed": True
+            },
+            "$set": {"last_seen": now}
+        },
+        upsert=True
+    )
+
+def save_airdrop_records(ops) -> Optional[Tuple[set, set]]:
+    """
+    Apply a cycle's airdrop upserts in one unordered bulk write.
+    Returns (inserted, failed) indexes into ops — callers broadcast only the inserted ones;
+    every other index not in failed was already stored. Returns None if the write failed as a whole.
+    """
+    if not ops:
+        return set(), set()
+    # non-critical, re-derivable data: acknowledged but not journaled
+    col = get_airdrops_col().with_options(write_concern=WriteConcern(w=1, j=False))
     try:
-        airdrops_col.insert_one({
-            "title": title,
-            "link": url,
-            "source": source,
-            "rank_score": rank_score,
-            "twitter": twitter,
-            "xp": xp_display,
-            "description": sample_desc,
-            "created_at": now_utc(),
-            "processed": True
-        })
+        return set(col.bulk_write(ops, ordered=False).upserted_ids), set()
+    except BulkWriteError as e:
+        # unordered: the rest of the batch still applied
+        errors = e.details.get("writeErrors", [])
+        logger.error(f"Bulk airdrop save partially failed: {errors[:3]}")
+        return {u["index"] for u in e.details.get("upserted", [])}, {w["index"] for w in errors}
     except Exception as e:
-        logger.error(f"Failed to save airdrop: {e}")
+        logger.error(f"Failed to save airdrops: {e}")
+        return None
 
 # ---------------------- External optional helpers (fallbacks) ----------------------
 try:
-    from utils.scam_analyzer import analyze_airdrop
+    from utils.scam_analyzer import analyze_airdrop, check_scam_batch
 except Exception:
     logger.warning("utils.scam_analyzer not found. Using fallback analyzer stub.")
     def analyze_airdrop(title, description, url):
         return {"score": 50, "verdict": "unknown", "details": {"note": "fallback analyzer used"}}
+    def check_scam_batch(links):
+        return set()
 
 try:
     from utils.scam_filter import basic_scam_check
@@ -171,11 +354,55 @@ except Exception:
             return {"is_scam": False, "flags": []}
 
 try:
-    from utils.twitter_rating import rate_twitter_buzz
+    from utils.twitter_rating import RATING_UNAVAILABLE, rate_twitter_buzz, rate_twitter_buzz_batch
 except Exception:
     logger.info("utils.twitter_rating not found. Using fallback rate_twitter_buzz.")
+    RATING_UNAVAILABLE = None
     def rate_twitter_buzz(handle_or_url):
         return 50
+    def rate_twitter_buzz_batch(tweet_urls):
+        return {}
+
+# Buzz for the same handle barely moves between 5-minute cycles; rate each at most hourly
+_tw_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_tw_locks: Dict[str, asyncio.Lock] = {}
+
+async def _cached_rate(handle):
+    # cache is only touched on the event loop; the blocking HTTP call runs in a worker thread
+    key = str(handle).strip().lower()  # "Foo", "foo " and "FOO" share one entry
+    if key in _tw_cache:
+        return _tw_cache[key]
+    # single-flight: concurrent communities sharing a handle wait for one lookup
+    lock = _tw_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            if key in _tw_cache:
+                return _tw_cache[key]
+            score = await asyncio.to_thread(rate_twitter_buzz, handle)
+            # a failed lookup (429, timeout, ...) is retried next cycle, not served for the hour
+            if score != RATING_UNAVAILABLE:
+                _tw_cache[key] = score
+            return score
+    finally:
+        if not lock.locked():
+            _tw_locks.pop(key, None)
+
+def _twitter_field(c):
+    raw = c.get('raw', {})
+    return raw.get('twitter') or raw.get('twitter_handle') or raw.get('twitterUrl')
+
+async def _prime_tw_cache(fields):
+    """Rate every uncached tweet URL with one batched lookup and seed _tw_cache with the results."""
+    urls = {f for f in fields if f and "/status/" in str(f) and str(f).strip().lower() not in _tw_cache}
+    if not urls:
+        return
+    try:
+        ratings = await asyncio.to_thread(rate_twitter_buzz_batch, list(urls))
+    except Exception as e:
+        logger.debug(f"Batched Twitter rating failed; falling back to per-community lookups: {e}")
+        return
+    for url, score in ratings.items():
+        _tw_cache[str(url).strip().lower()] = score
 
 # ---------------------- Scoring helpers ----------------------
 def run_scam_checks(title, description, link):
@@ -227,36 +454,74 @@ def run_scam_checks(title, description, link):
         "basic_flags": basic_res
     }
 
+def _as_float(value, default: float, name: str) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except Exception:
+        logger.debug(f"compute_rank_score: invalid {name}={value!r}, using {default}")
+        return default
+
 def compute_rank_score(scam_score, twitter_score, xp):
     """
     Defensive compute_rank_score:
     - tolerates non-numeric or None scam/twitter scores
     - uses safe defaults when conversion fails
     """
-    # scam_score -> numeric fallback 50.0
-    try:
-        s = 50.0 if scam_score is None else float(scam_score)
-    except Exception:
-        logger.debug(f"compute_rank_score: invalid scam_score={scam_score!r}, using 50.0")
-        s = 50.0
-
-    # twitter_score -> numeric fallback 50.0
-    try:
-        t = 50.0 if twitter_score is None else float(twitter_score)
-    except Exception:
-        logger.debug(f"compute_rank_score: invalid twitter_score={twitter_score!r}, using 50.0")
-        t = 50.0
-
-    # xp -> numeric fallback 0.0
-    try:
-        x = float(xp)
-    except Exception:
-        x = 0.0
-
+    s = _as_float(scam_score, 50.0, "scam_score")
+    t = _as_float(twitter_score, 50.0, "twitter_score")
+    x = _as_float(xp, 0.0, "xp")
     rank = (100.0 - s) * 0.45 + t * 0.35 + math.log1p(x) * 2.0
     return round(rank, 2)
 
 # ---------------------- Messaging helpers ----------------------
+# One long-lived HTTP session for Bot API calls: a broadcast reuses pooled keep-alive
+# connections instead of a new TLS handshake per message
+_tg_session: Optional[aiohttp.ClientSession] = None
+_tg_loop = None
+
+def _discard_tg_session(session: aiohttp.ClientSession, loop):
+    """
+    Close a session left behind by another event loop. Its sockets belong to that loop, so
+    the close is scheduled there; a loop that already stopped can't close them any more.
+    """
+    if session.closed:
+        return
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        logger.warning("Telegram session outlived its event loop and was dropped unclosed; "
+                       "call close_telegram_session() before the loop ends")
+
+def _get_tg_session() -> aiohttp.ClientSession:
+    global _tg_session, _tg_loop
+    loop = asyncio.get_running_loop()
+    if _tg_session is not None and _tg_loop is not loop:
+        _discard_tg_session(_tg_session, _tg_loop)
+    if _tg_session is None or _tg_session.closed or _tg_loop is not loop:
+        # DNS cached (and resolved on the loop via aiodns when installed) and idle sockets
+        # kept past the poll interval's quiet stretches
+        resolver = AsyncResolver() if AsyncResolver is not None else None
+        _tg_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75, resolver=resolver
+            ),
+            timeout=aiohttp.ClientTimeout(total=12),
+        )
+        _tg_loop = loop
+    return _tg_session
+
+async def close_telegram_session():
+    """Close the shared Bot API session (call at shutdown)."""
+    global _tg_session, _tg_loop
+    if _tg_session is not None and not _tg_session.closed:
+        try:
+            await _tg_session.close()
+        except Exception:
+            pass
+    _tg_session = _tg_loop = None
+
 async def send_telegram_message(chat_id, text, parse_mode="Markdown"):
     if not BOT_TOKEN:
         logger.warning("BOT_TOKEN not set; skipping telegram send.")
@@ -271,17 +536,16 @@ async def send_telegram_message(chat_id, text, parse_mode="Markdown"):
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(send_url, json=payload, timeout=12) as resp:
-                resp.raise_for_status()
-                return True
+        async with _get_tg_session().post(send_url, json=payload) as resp:
+            resp.raise_for_status()
+            return True
     except Exception as e:
         logger.error(f"[Telegram] send error to {chat_id}: {e}")
         return False
 
 async def broadcast_to_all_users(text, skip_admin=False):
     try:
-        users = list(users_col.find({}))
+        users = await asyncio.to_thread(lambda: list(get_users_col().find({}, {"_id": 0, "chat_id": 1})))
         sent = 0
         for u in users:
             chat_id = u.get("chat_id")
@@ -301,15 +565,222 @@ async def broadcast_to_all_users(text, skip_admin=False):
         logger.error(f"Broadcast failed: {e}")
         return 0
 
+# ---------------------- Playwright (shared browser/context) ----------------------
+_pw_lock = asyncio.Lock()
+_pw = _browser = _context = None
+_pw_loop = None
+# pages handed out by the current context / pages still open on it
+_ctx_uses = 0
+_ctx_open = 0
+
+# Long-running headless launch: bounded renderer count and JS heap so RSS stays flat
+# across cycles (paired with the context recycling in _new_page)
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-features=Translate,TranslateUI,BackForwardCache,IsolateOrigins,site-per-process",
+    "--blink-settings=imagesEnabled=false",
+    "--js-flags=--max-old-space-size=384",
+    "--renderer-process-limit=2",
+]
+
+# nothing we scrape needs these; aborting them cuts bytes and renderer memory per page
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "segment.io", "hotjar.com", "sentry.io")
+
+async def _block_heavy(route):
+    req = route.request
+    if req.resource_type in BLOCKED_RESOURCE_TYPES or any(h in req.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _new_context(browser):
+    context = await browser.new_context(
+        user_agent=random.choice(USER_AGENTS),
+        locale="en-US",
+    )
+    # route handlers live (and leak) with the context; _new_page() recycles it periodically
+    await context.route("**/*", _block_heavy)
+    return context
+
+async def _get_context():
+    """
+    Lazily start Playwright and return a long-lived browser context.
+    Chromium is launched once and reused across poll cycles; callers only open
+    and close their own pages. Objects are re-created if the event loop changed
+    (e.g. a previous asyncio.run() owned them).
+    """
+    global _pw, _browser, _context, _pw_loop, _ctx_uses, _ctx_open
+    try:
+        from playwright.async_api import async_playwright
+    except Exception as e:
+        raise RuntimeError("Playwright not available. Install playwright and run in Playwright-compatible environment.") from e
+
+    loop = asyncio.get_running_loop()
+    async with _pw_lock:
+        if _context is not None and _pw_loop is loop:
+            return _context
+        _pw = _browser = _context = None
+        _pw = await async_playwright().start()
+        try:
+            _browser = await _pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            _context = await _new_context(_browser)
+        except Exception:
+            try:
+                await _pw.stop()
+            except Exception:
+                pass
+            _pw = _browser = _context = None
+            raise
+        _pw_loop = loop
+        _ctx_uses = _ctx_open = 0
+        logger.info("Playwright browser launched (shared across cycles)")
+        return _context
+
+def _on_page_close(_page):
+    global _ctx_open
+    _ctx_open = max(0, _ctx_open - 1)
+
+async def _new_page():
+    """
+    Open a page on the shared context. Once CONTEXT_RECYCLE_PAGES pages have been
+    handed out and none is still open, the context is swapped for a fresh one first:
+    Chromium memory (and route handlers) accumulate per context, the browser stays up.
+    """
+    global _context, _ctx_uses, _ctx_open
+    await _get_context()
+    async with _pw_lock:
+        if _ctx_uses >= CONTEXT_RECYCLE_PAGES and _ctx_open == 0:
+            old = _context
+            _context = await _new_context(_browser)
+            _ctx_uses = 0
+            try:
+                await old.close()
+            except Exception:
+                pass
+            logger.debug("Recycled Playwright context")
+        page = await _context.new_page()
+        _ctx_uses += 1
+        _ctx_open += 1
+        page.on("close", _on_page_close)
+        return page
+
+async def close_playwright():
+    """Tear down the shared Playwright context/browser (call at shutdown)."""
+    global _pw, _browser, _context, _pw_loop, _ctx_uses, _ctx_open
+    async with _pw_lock:
+        for obj in (_context, _browser):
+            if obj is not None:
+                try:
+                    await obj.close()
+                except Exception:
+                    pass
+        if _pw is not None:
+            try:
+                await _pw.stop()
+            except Exception:
+                pass
+        _pw = _browser = _context = None
+        _pw_loop = None
+        _ctx_uses = _ctx_open = 0
+
+def _run_with_playwright(coro):
+    """
+    Run a Playwright coroutine from sync code. asyncio.run() owns a temporary loop,
+    so the shared browser and Bot API session opened inside it are closed before that loop goes away.
+    """
+    async def _runner():
+        try:
+            return await coro
+        finally:
+            await close_playwright()
+            await close_telegram_session()
+    return asyncio.run(_runner())
+
 # ---------------------- Discovery: Requests-based paginated fetch ----------------------
 import requests
+from requests.adapters import HTTPAdapter
+
+# kept for the process lifetime so API pages reuse keep-alive connections across cycles.
+# requests advertises "gzip, deflate, br" on its own once Brotli is installed, and urllib3
+# decodes it in C (also on the ijson streaming path, via decode_content)
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+STREAM_PARSE_MIN_BYTES = 256 * 1024
+_ITEM_PREFIXES = ("communities.item", "data.item", "items.item", "results.item", "item")
+# raw fields read downstream (_compact_item_from_api + twitter lookup in run_scrape_once)
+_SLIM_KEYS = (
+    "id", "subdomain", "slug", "name", "title", "label", "displayName",
+    "href", "url", "twitter", "twitter_handle", "twitterUrl",
+)
+
+def _slim_item(it: Any) -> Dict:
+    if not isinstance(it, dict):
+        return {}
+    return {k: it[k] for k in _SLIM_KEYS if k in it}
+
+def _stream_items(fp) -> List[Dict]:
+    """
+    Incrementally parse one API page with ijson, projecting each community down to
+    _SLIM_KEYS as soon as it is complete, so the full raw page is never held in memory.
+    """
+    items: List[Dict] = []
+    builder = None
+    item_prefix = None
+    for prefix, event, value in ijson.parse(fp):
+        if builder is None:
+            if event == "start_map" and (prefix == item_prefix or (item_prefix is None and prefix in _ITEM_PREFIXES)):
+                item_prefix = prefix
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            continue
+        builder.event(event, value)
+        if event == "end_map" and prefix == item_prefix:
+            items.append(_slim_item(builder.value))
+            builder = None
+    return items
+
+# zealy.py has always looked under "communities" first (as the ijson prefixes above do);
+# the standalone scripts keep _zealy_core's "data"-first default
+_ITEM_KEYS = ("communities", "data", "items", "results")
+
+# (page, limit) -> (ETag, Last-Modified, items) from the last 200, so unchanged pages come back as
+# bodiless 304s; only pages that sent a validator are kept
+_page_validators: TTLCache = TTLCache(maxsize=512, ttl=86400)
+
+# (connect, read): a stalled handshake fails fast, a slow page still gets its time
+API_TIMEOUT = (5, 15)
+
+def _get_api_page(session, headers: Dict, params: Dict):
+    """
+    GET one communities page, retrying 429/5xx and connection errors with jittered backoff.
+    Other 4xx (the 403 bot check included) are returned on the first attempt.
+    """
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            resp = session.get(API_BASE, headers=headers, params=params, timeout=API_TIMEOUT, stream=True)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == RETRY_ATTEMPTS:
+                raise
+            delay = backoff_delay(attempt)
+            logger.debug(f"Page {params.get('page')} failed ({e}); retrying in {delay:.1f}s")
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                return resp
+            delay = backoff_delay(attempt, resp.headers.get("Retry-After"))
+            logger.debug(f"Page {params.get('page')} returned {resp.status_code}; retrying in {delay:.1f}s")
+            resp.close()
+        time.sleep(delay)
 
 def fetch_with_requests_paginated(limit: int = PAGE_LIMIT, max_pages: int = 10) -> List[Dict]:
     """
     Fast attempt to fetch communities pages using requests with browser-like headers.
     Raises requests.HTTPError if blocked (e.g., 403).
     """
-    session = requests.Session()
+    session = HTTP_SESSION
     headers = {
         "Accept": "application/json, text/plain, */*",
         "User-Agent": random.choice(USER_AGENTS),
@@ -321,27 +792,36 @@ def fetch_with_requests_paginated(limit: int = PAGE_LIMIT, max_pages: int = 10)
     all_items: List[Dict] = []
     for page in range(0, max_pages):
         params = {"category": "all", "page": page, "limit": limit}
-        resp = session.get(API_BASE, headers=headers, params=params, timeout=15)
-        if resp.status_code == 403:
-            # blocked
-            raise requests.HTTPError(f"403 Forbidden for page {page}", response=resp)
-        resp.raise_for_status()
-        data = resp.json()
-        # find list in known keys
-        items = []
-        if isinstance(data, dict):
-            for k in ("communities", "data", "items", "results"):
-                if k in data and isinstance(data[k], list):
-                    items = data[k]
-                    break
-            if not items:
-                # fallback: first list value
-                for v in data.values():
-                    if isinstance(v, list):
-                        items = v
-                        break
-        elif isinstance(data, list):
-            items = data
+        key = (page, limit)
+        cached = _page_validators.get(key)
+        page_headers = headers
+        if cached:
+            etag, last_modified, _ = cached
+            page_headers = dict(headers)
+            if etag:
+                page_headers["If-None-Match"] = etag
+            if last_modified:
+                page_headers["If-Modified-Since"] = last_modified
+        with _get_api_page(session, page_headers, params) as resp:
+            if resp.status_code == 403:
+                # blocked
+                raise requests.HTTPError(f"403 Forbidden for page {page}", response=resp)
+            if resp.status_code == 304 and cached:
+                # unchanged since last cycle: no body to download or parse
+                items = cached[2]
+            else:
+                resp.raise_for_status()
+                if ijson is not None and int(resp.headers.get("Content-Length") or 0) > STREAM_PARSE_MIN_BYTES:
+                    # large page: stream-parse and keep only the fields we use
+                    resp.raw.decode_content = True
+                    items = _stream_items(resp.raw)
+                else:
+                    data = orjson.loads(resp.content) if orjson is not None else resp.json()
+                    items = find_items(data, _ITEM_KEYS)
+                etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+                if etag or last_modified:
+                    # keep only the fields read downstream; a 304 replays these
+                    _page_validators[key] = (etag, last_modified, [_slim_item(it) for it in items])
         if not items:
             break
         all_items.extend(items)
@@ -350,24 +830,14 @@ def fetch_with_requests_paginated(limit: int = PAGE_LIMIT, max_pages: int = 10)
     return all_items
 
 # ---------------------- Discovery: Browser-context paginated fetch (Playwright) ----------------------
-async def fetch_with_playwright_paginated(limit: int = PAGE_LIMIT, max_pages: int = MAX_PAGES, save_compact: Optional[str]=None) -> List[Dict]:
+async def fetch_with_playwright_paginated(limit: int = PAGE_LIMIT, max_pages: int = MAX_PAGES) -> List[Dict]:
     """
     Use Playwright to perform window.fetch() from page context to call the communities API
     and page through results. Returns list of raw items (un-normalized).
     """
-    try:
-        from playwright.async_api import async_playwright
-    except Exception as e:
-        raise RuntimeError("Playwright not available. Install playwright and run in Playwright-compatible environment.") from e
-
     all_items: List[Dict] = []
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-        context = await browser.new_context(
-            user_agent=random.choice(USER_AGENTS),
-            locale="en-US",
-        )
-        page = await context.new_page()
+    page = await _new_page()
+    try:
         # Visit explore so site state is set (cookies, origins)
         try:
             await page.goto(f"{BASE_URL}/explore", wait_until="networkidle", timeout=30000)
@@ -376,21 +846,8 @@ async def fetch_with_playwright_paginated(limit: int = PAGE_LIMIT, max_pages: in
 
         page_num = 0
         for _ in range(max_pages):
-            url = f"{API_BASE}?category=all&page={page_num}&limit={limit}"
-            result = await page.evaluate(
-                """async (url) => {
-                    try {
-                        const res = await fetch(url, { method: 'GET', credentials: 'omit', headers: { 'Accept': 'application/json, text/plain, */*' } });
-                        const status = res.status;
-                        let json = null;
-                        try { json = await res.json(); } catch(e) { json = null; }
-                        return { status, json };
-                    } catch (err) {
-                        return { error: String(err) };
-                    }
-                }""",
-                url,
-            )
+            url = page_url(page_num, limit)
+            result = await page.evaluate(BROWSER_FETCH_JS, url)
             if "error" in result:
                 logger.error(f"Browser fetch error page {page_num}: {result['error']}")
                 break
@@ -398,216 +855,375 @@ async def fetch_with_playwright_paginated(limit: int = PAGE_LIMIT, max_pages: in
             if status != 200:
                 logger.error(f"Non-200 status for page {page_num}: {status}")
                 break
-            json_body = result.get("json")
-            # extract items
-            items = []
-            if isinstance(json_body, dict):
-                for k in ("communities", "data", "items", "results"):
-                    if k in json_body and isinstance(json_body[k], list):
-                        items = json_body[k]
-                        break
-                if not items:
-                    for v in json_body.values():
-                        if isinstance(v, list):
-                            items = v
-                            break
-            elif isinstance(json_body, list):
-                items = json_body
+            items = find_items(result.get("json"), _ITEM_KEYS)
             logger.info(f"Fetched page {page_num}: {len(items)} items (browser-context)")
             if not items:
                 break
             all_items.extend(items)
             page_num += 1
             await asyncio.sleep(0.15)
-        # Save compact if requested
-        if save_compact:
-            try:
-                compact = [_compact_item_from_api(it) for it in all_items]
-                with open(save_compact, "w", encoding="utf-8") as f:
-                    json.dump(compact, f, indent=2, ensure_ascii=False)
-                logger.info(f"Saved compact JSON -> {save_compact}")
-            except Exception as e:
-                logger.warning(f"Failed to save compact JSON: {e}")
-        await browser.close()
+    finally:
+        try:
+            await page.close()
+        except Exception:
+            pass
     return all_items
 
-# ---------------------- High-level unified discovery ----------------------
-def discover_communities(limit: int = 30, requests_pages_try: int = 10, save_compact: Optional[str] = COMPACT_JSON_PATH) -> List[Dict]:
-    """
-    Primary: try requests-first (fast). If requests blocked/returns nothing, try browser-context fetch.
-    Returns compact normalized list: {slug,title,href,url,...}
-    """
-    raw_items: List[Dict] = []
-    # Try requests first
+# ---------------------- Discovery cache (shared via Mongo) ----------------------
+# Overlapping jobs (live + interval) and extra bot workers would each re-crawl the
+# same listing within seconds; the last raw discovery result is kept in one Mongo
+# document and reused while it is fresh and covers the requested limit.
+DISCOVERY_CACHE_ID = "explore"
+
+def _load_discovery_cache(limit: int) -> Optional[List[Dict]]:
+    if DISCOVERY_CACHE_SECONDS <= 0:
+        return None
     try:
-        logger.info("Discovery: trying fast requests-based pagination...")
-        raw_items = fetch_with_requests_paginated(limit=limit, max_pages=requests_pages_try)
-        logger.info(f"Requests-based discovery returned {len(raw_items)} items")
+        cutoff = now_utc() - timedelta(seconds=DISCOVERY_CACHE_SECONDS)
+        doc = get_discovery_cache_col().find_one(
+            {"_id": DISCOVERY_CACHE_ID, "fetched_at": {"$gte": cutoff}, "limit": {"$gte": limit}},
+            {"_id": 0, "items": 1},
+        )
+        return doc["items"] if doc and doc.get("items") else None
     except Exception as e:
-        logger.info(f"Requests-based discovery failed/blocked: {e}")
+        logger.debug(f"Discovery cache read failed: {e}")
+        return None
 
-    # If requests returned nothing, fallback to browser
-    if not raw_items:
-        logger.info("Discovery: falling back to Playwright browser-context fetch...")
+def _store_discovery_cache(items: List[Dict], limit: int):
+    if DISCOVERY_CACHE_SECONDS <= 0 or not items:
+        return
+    # only the fields read downstream: the browser path can return MAX_PAGES x limit raw
+    # items, which would put the whole document at risk of Mongo's 16MB cap
+    slim = [s for s in (_slim_item(it) for it in items) if s]
+    try:
+        get_discovery_cache_col().replace_one(
+            {"_id": DISCOVERY_CACHE_ID},
+            {"items": slim, "limit": limit, "fetched_at": now_utc()},
+            upsert=True,
+        )
+    except Exception as e:
+        logger.warning(f"Discovery cache write failed: {e}")
+
+# ---------------------- Discovery: DOM fallback (Playwright) ----------------------
+def _communities_from_anchors(anchors, limit: int) -> List[Dict]:
+    """Turn (href, text) anchor pairs into raw community items, one per slug, up to limit."""
+    items = []
+    seen = set()
+    # both anchor sources only return /c/ links, so there is nothing left to filter on href
+    for href, text in anchors:
         try:
-            raw_items = asyncio.run(fetch_with_playwright_paginated(limit=limit, max_pages=MAX_PAGES, save_compact=save_compact))
-            logger.info(f"Browser-context discovery returned {len(raw_items)} items")
-        except Exception as e:
-            logger.warning(f"Browser-context discovery failed: {e}")
-            # Last resort: try DOM scraping using a headless browser (reuse playwright if available)
-            try:
-                # attempt to run original anchor-based DOM scraper if Playwright available
-                from playwright.async_api import async_playwright
-                async def _dom_scrape():
-                    async with async_playwright() as p:
-                        browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-                        context = await browser.new_context(user_agent=random.choice(USER_AGENTS))
-                        page = await context.new_page()
-                        await page.goto(f"{BASE_URL}/explore", wait_until="domcontentloaded", timeout=30000)
-                        # reuse original anchor-based strategy minimal
-                        await asyncio.sleep(2)
-                        anchors = await page.query_selector_all("a[href*='/c/']")
-                        items = []
-                        seen = set()
-                        for a in anchors:
-                            try:
-                                href = await a.get_attribute('href')
-                                if not href or '/c/' not in href:
-                                    continue
-                                slug = href.split('/c/')[-1].split('/')[0]
-                                if slug in seen:
-                                    continue
-                                seen.add(slug)
-                                title = (await a.text_content()) or slug
-                                items.append({"id": slug, "name": title.strip(), "subdomain": slug})
-                                if len(items) >= limit:
-                                    break
-                            except Exception:
-                                continue
-                        await browser.close()
-                        return items
-                raw_items = asyncio.run(_dom_scrape())
-                logger.info(f"DOM fallback discovery returned {len(raw_items)} items")
-            except Exception as e2:
-                logger.error(f"DOM fallback discovery also failed: {e2}")
-                raw_items = []
+            slug = href.split('/c/')[-1].split('/')[0]
+            if slug in seen:
+                continue
+            seen.add(slug)
+            title = text or slug
+            items.append({"id": slug, "name": title.strip(), "subdomain": slug})
+            if len(items) >= limit:
+                break
+        except Exception:
+            continue
+    return items
+
+async def _dom_scrape_communities(limit: int) -> List[Dict]:
+    """Last-resort discovery: read community anchors off the rendered explore page."""
+    page = await _new_page()
+    try:
+        await page.goto(f"{BASE_URL}/explore", wait_until="domcontentloaded", timeout=30000)
+        # reuse original anchor-based strategy minimal
+        await asyncio.sleep(2)
+        if LXML_AVAILABLE:
+            # one content() round-trip + lxml's C parser instead of two IPC calls per anchor;
+            # the generator is consumed (i.e. the page parsed) in a worker thread so the
+            # parse doesn't stall the bot's other coroutines
+            html = await page.content()
+            anchors = islice(iter_community_anchors(html), MAX_ANCHORS)
+            return await asyncio.to_thread(_communities_from_anchors, anchors, limit)
+        anchors = await page.eval_on_selector_all(COMMUNITY_ANCHOR_SELECTOR, ANCHORS_JS, MAX_ANCHORS)
+        return _communities_from_anchors(anchors, limit)
+    finally:
+        try:
+            await page.close()
+        except Exception:
+            pass
 
-    # Normalize to compact result
+# ---------------------- High-level unified discovery ----------------------
+def _normalize_communities(raw_items: List[Dict], limit: int, skip_recent: bool = False) -> List[Dict]:
+    """Dedupe raw API/DOM items by slug and normalize to {slug,title,href,url,raw}."""
     compact = []
     seen_slugs = set()
+    if skip_recent:
+        _prune_recent()
+    now = time.monotonic()
     for it in raw_items:
         try:
-            ci = _compact_item_from_api(it)
-            slug = ci.get("slug") or ""
+            raw_slug = it.get("id") or it.get("subdomain") or it.get("slug")
+            # the same community repeated across pages/anchors is dropped before any normalizing
+            if raw_slug in seen_slugs:
+                continue
+            if skip_recent and _is_recent(raw_slug, now):
+                continue
+            slug, title, href = _compact_item_from_api(it)
+            slug = slug or ""
             if not slug or slug in seen_slugs:
                 continue
+            # slugs/urls recur every cycle and live on in _recent_slugs, the seen/known sets
+            # and the caches: interning keeps one copy and lets lookups hit the identity fast path
+            if isinstance(slug, str):
+                slug = sys.intern(slug)
             seen_slugs.add(slug)
-            title = ci.get("title") or slug.replace('-', ' ').title()
-            href = ci.get("href") or f"/c/{slug}"
+            title = title or slug.replace('-', ' ').title()
+            href = href or f"/c/{slug}"
             compact.append({
                 "slug": slug,
                 "title": title,
                 "href": href,
-                "url": f"{BASE_URL}{href}" if href.startswith("/") else href,
-                "raw": ci.get("raw", it)
+                "url": sys.intern(f"{BASE_URL}{href}" if href.startswith("/") else href),
+                "raw": it
             })
             if len(compact) >= limit:
                 break
         except Exception:
             continue
+    return compact
 
-    # Save compact JSON to file for later use (non-fatal)
-    if save_compact:
+async def _fetch_raw_communities(limit: int, requests_pages_try: int) -> List[Dict]:
+    """
+    Raw (un-normalized) discovery items: the shared discovery cache, else requests-first,
+    then browser-context fetch, then DOM scraping. Empty only if every source came back empty.
+    """
+    raw_items: List[Dict] = await asyncio.to_thread(_load_discovery_cache, limit) or []
+    if raw_items:
+        logger.info(f"Discovery: reusing {len(raw_items)} items fetched in the last {DISCOVERY_CACHE_SECONDS}s")
+        return raw_items
+
+    # Try requests first
+    try:
+        logger.info("Discovery: trying fast requests-based pagination...")
+        raw_items = await asyncio.to_thread(fetch_with_requests_paginated, limit, requests_pages_try)
+        logger.info(f"Requests-based discovery returned {len(raw_items)} items")
+    except Exception as e:
+        logger.info(f"Requests-based discovery failed/blocked: {e}")
+
+    # If requests returned nothing, fallback to browser
+    if not raw_items:
+        logger.info("Discovery: falling back to Playwright browser-context fetch...")
         try:
-            with open(save_compact, "w", encoding="utf-8") as f:
-                json.dump(compact, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved compact list -> {save_compact}")
+            raw_items = await fetch_with_playwright_paginated(limit=limit, max_pages=MAX_PAGES)
+            logger.info(f"Browser-context discovery returned {len(raw_items)} items")
         except Exception as e:
-            logger.warning(f"Failed to save compact list: {e}")
+            logger.warning(f"Browser-context discovery failed: {e}")
+            # Last resort: try DOM scraping using the shared headless browser
+            try:
+                raw_items = await _dom_scrape_communities(limit)
+                logger.info(f"DOM fallback discovery returned {len(raw_items)} items")
+            except Exception as e2:
+                logger.error(f"DOM fallback discovery also failed: {e2}")
+                raw_items = []
+
+    await asyncio.to_thread(_store_discovery_cache, raw_items, limit)
+    return raw_items
+
+async def _save_compact(path: Optional[str], compact: List[Dict]):
+    """Save the compact JSON to file for later use (non-fatal)."""
+    if not path:
+        return
+    try:
+        await asyncio.to_thread(_write_json, path, compact)
+        logger.info(f"Saved compact list -> {path}")
+    except Exception as e:
+        logger.warning(f"Failed to save compact list: {e}")
 
+async def discover_communities_async(limit: int = 30, requests_pages_try: int = 10, save_compact: Optional[str] = COMPACT_JSON_PATH, skip_recent: bool = False) -> List[Dict]:
+    """
+    Primary: try requests-first (fast). If requests blocked/returns nothing, try browser-context fetch.
+    Returns compact normalized list: {slug,title,href,url,...}
+    skip_recent: drop slugs already handled in the last 24h by this process (see _recent_slugs).
+    Blocking requests/file I/O run in a worker thread so the event loop keeps serving other tasks.
+    """
+    raw_items = await _fetch_raw_communities(limit, requests_pages_try)
+    compact = _normalize_communities(raw_items, limit, skip_recent=skip_recent)
+    await _save_compact(save_compact, compact)
     return compact
 
+def discover_communities(limit: int = 30, requests_pages_try: int = 10, save_compact: Optional[str] = COMPACT_JSON_PATH, skip_recent: bool = False) -> List[Dict]:
+    """
+    Sync wrapper around discover_communities_async() for callers without a running
+    event loop (scripts/tests). Async code must await discover_communities_async().
+    """
+    return _run_with_playwright(discover_communities_async(limit, requests_pages_try, save_compact, skip_recent))
+
+# ---------------------- Adaptive concurrency (AIMD) ----------------------
+class AIMDLimiter:
+    """
+    TCP-style adaptive concurrency limit for requests against Zealy.
+    Additive increase on success, multiplicative decrease on overload signals
+    (HTTP 403/429, timeouts); the window is clamped to [lo, hi].
+    Use as `async with limiter:` and report the outcome via on_ok()/on_overload().
+    """
+    def __init__(self, lo: int = 1, hi: int = 16, init: int = 2, step: float = 0.25):
+        self.lo = lo
+        self.hi = max(lo, hi)
+        self.step = step
+        self.cc = float(min(max(init, lo), self.hi))
+        self._in_flight = 0
+        self._cond: Optional[asyncio.Condition] = None
+
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    @property
+    def limit(self) -> int:
+        return max(self.lo, int(self.cc))
+
+    async def __aenter__(self):
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        cond = self._condition()
+        async with cond:
+            self._in_flight -= 1
+            cond.notify_all()
+        return False
+
+    def on_ok(self):
+        self.cc = min(self.hi, self.cc + self.step)
+
+    def on_overload(self, reason=None):
+        self.cc = max(self.lo, self.cc / 2)
+        logger.info(f"Zealy overload ({reason}); concurrency window -> {self.limit}")
+
+# quest fetching can never exceed the page pool, so the pool size is the ceiling
+_quest_limiter = AIMDLimiter(lo=1, hi=QUEST_PAGE_POOL, init=2)
+
 # ---------------------- Quest fetching (reusable browser/context) ----------------------
+_XP_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?\s*[KM]?)\s*(?:XP|point|pts)', re.IGNORECASE)
+# "500", "1,000", "1.5K", "2M" -> number + optional multiplier suffix
+# the number is matched whole ((?![.,]?\d) stops backtracking into it); a K/M suffix only
+# counts when it isn't the start of a word, though it may run straight into "XP"/"pts"
+_XP_VALUE_RE = re.compile(
+    r'(\d[\d,]*(?:\.\d+)?)(?![.,]?\d)\s*(?:([KM])(?=xp|pts?\b|points?\b|[^a-z]|$))?', re.IGNORECASE
+)
+_XP_MULTIPLIERS = {"": 1, "K": 1_000, "M": 1_000_000}
+
+def _parse_xp(value: Any) -> Optional[int]:
+    """Parse an XP label into an int (handles thousands separators and K/M suffixes); None if there is no number."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    m = _XP_VALUE_RE.search(str(value or ""))
+    if not m:
+        return None
+    try:
+        return int(float(m.group(1).replace(',', '')) * _XP_MULTIPLIERS[(m.group(2) or '').upper()])
+    except ValueError:
+        return None
+
+QUEST_SELECTORS = [
+    '[data-testid*="quest"]',
+    '[class*="quest"]',
+    '[class*="Quest"]',
+    'a[href*="/quest/"]',
+    'div[class*="card"]',
+    'li',
+    'article'
+]
+
+# Walks QUEST_SELECTORS in priority order inside the page and returns the raw text
+# fields of up to `limit` elements from the first selector that yields any, so the
+# whole extraction is a single CDP round trip. Parsing stays in _quest_from_fields.
+_QUEST_EXTRACT_JS = """(args) => {
+    const { selectors, limit } = args;
+    const pick = (el, sel) => { const n = el.querySelector(sel); return n ? (n.textContent || '') : null; };
+    for (const sel of selectors) {
+        let nodes;
+        try { nodes = document.querySelectorAll(sel); } catch (e) { continue; }
+        const out = [];
+        for (const el of Array.from(nodes).slice(0, limit)) {
+            const fields = {
+                title: pick(el, 'h3, h4, [class*="title"], [class*="Title"]'),
+                xp: pick(el, '[class*="xp"], [class*="XP"], [class*="reward"], [class*="Reward"]'),
+                desc: pick(el, 'p, [class*="description"], [class*="desc"]'),
+                text: el.textContent || ''
+            };
+            if ((fields.title || '').trim() || fields.text.trim()) out.push(fields);
+        }
+        if (out.length) return out;
+    }
+    return [];
+}"""
+
+def _quest_from_fields(fields: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """Build a quest dict from the raw text fields of one element (None if it has no title)."""
+    full_text = fields.get("text") or ""
+    # title
+    title = (fields.get("title") or "").strip()
+    if not title:
+        title = full_text.strip()[:100]
+    if not title:
+        return None
+    # xp
+    xp = None
+    xp_text = fields.get("xp")
+    if xp_text:
+        parsed = _parse_xp(xp_text)
+        xp = str(parsed) if parsed is not None else None
+    if not xp and full_text:
+        m = _XP_RE.search(full_text)
+        if m:
+            parsed = _parse_xp(m.group(1))
+            xp = str(parsed) if parsed is not None else None
+    if not xp:
+        xp = "100"
+    # description
+    description = (fields.get("desc") or "").strip()[:200]
+    if not description and full_text:
+        # get a snippet
+        for s in full_text.strip().split('.'):
+            if len(s.strip()) > 20:
+                description = s.strip()[:200]
+                break
+    if not description:
+        description = title[:200]
+    return {
+        "title": title,
+        "xp": xp,
+        "description": description
+    }
+
 async def fetch_community_quests_with_page(page, slug: str, limit: int = 12) -> List[Dict]:
     """
     Uses the provided Playwright page (reused) to fetch quests for a community via DOM.
     This function assumes page is an open Playwright Page object.
     """
     try:
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
         url = f"{BASE_URL}/c/{slug}/questboard"
-        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-        # quick wait for React to hydrate
-        await asyncio.sleep(3)
-        quest_selectors = [
-            '[data-testid*="quest"]',
-            '[class*="quest"]',
-            '[class*="Quest"]',
-            'a[href*="/quest/"]',
-            'div[class*="card"]',
-            'li',
-            'article'
-        ]
-        quests = []
-        for selector in quest_selectors:
+        async with _quest_limiter:
             try:
-                elements = await page.query_selector_all(selector)
-                if not elements:
-                    continue
-                for element in elements[:limit]:
-                    try:
-                        # title
-                        title = None
-                        title_elem = await element.query_selector('h3, h4, [class*="title"], [class*="Title"]')
-                        if title_elem:
-                            title = (await title_elem.text_content() or "").strip()
-                        if not title:
-                            title = (await element.text_content() or "").strip()[:100]
-                        if not title:
-                            continue
-                        # xp
-                        xp = None
-                        xp_elem = await element.query_selector('[class*="xp"], [class*="XP"], [class*="reward"], [class*="Reward"]')
-                        if xp_elem:
-                            xp_text = await xp_elem.text_content()
-                            if xp_text:
-                                xp = ''.join(ch for ch in xp_text if ch.isdigit())
-                        if not xp:
-                            full_text = await element.text_content()
-                            if full_text:
-                                m = re.search(r'(\d+)\s*(?:XP|xp|point|pts)', full_text, re.IGNORECASE)
-                                if m:
-                                    xp = m.group(1)
-                        if not xp:
-                            xp = "100"
-                        # description
-                        description = None
-                        desc_elem = await element.query_selector('p, [class*="description"], [class*="desc"]')
-                        if desc_elem:
-                            description = (await desc_elem.text_content() or "").strip()[:200]
-                        if not description:
-                            # get a snippet
-                            text = await element.text_content()
-                            if text:
-                                sentences = text.strip().split('.')
-                                for s in sentences:
-                                    if len(s.strip()) > 20:
-                                        description = s.strip()[:200]
-                                        break
-                        if not description:
-                            description = title[:200]
-                        quests.append({
-                            "title": title,
-                            "xp": xp,
-                            "description": description
-                        })
-                        if len(quests) >= limit:
-                            break
-                    except Exception:
-                        continue
-                if quests:
-                    break
-            except Exception:
-                continue
+                resp = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            except PlaywrightTimeout as e:
+                _quest_limiter.on_overload(e)
+                raise
+            if resp is not None and resp.status in (403, 429):
+                _quest_limiter.on_overload(f"HTTP {resp.status}")
+            else:
+                _quest_limiter.on_ok()
+            # wait for React to hydrate: returns as soon as any quest-like node appears
+            try:
+                await page.wait_for_selector(",".join(QUEST_SELECTORS), timeout=5000)
+            except PlaywrightTimeout:
+                pass
+        quests = []
+        for fields in await page.evaluate(_QUEST_EXTRACT_JS, {"selectors": QUEST_SELECTORS, "limit": limit}):
+            quest = _quest_from_fields(fields)
+            if quest:
+                quests.append(quest)
         # fallback: one default quest if none found
         if not quests:
             quests = [{
@@ -625,59 +1241,90 @@ async def fetch_community_quests_with_page(page, slug: str, limit: int = 12) ->
         }]
 
 # ---------------------- Processing loop ----------------------
+class _Processed(NamedTuple):
+    """One community handled by run_scrape_once, held until the bulk save + broadcast."""
+    community: Dict
+    message: Optional[str]  # None for scams: saved, never broadcast
+    upsert: UpdateOne
+
 async def run_scrape_once(limit=25):
     """
     Single-run scraping pipeline:
-     - Discover communities using discover_communities()
-     - Reuse Playwright browser/page to fetch quests for communities
+     - Discover communities using discover_communities_async()
+     - Fetch quests concurrently over a small pool of Playwright pages
      - Score, save to DB and broadcast
+    Returns the number of new drops broadcast (0 on a quiet cycle), or False on failure.
     """
     logger.info("🚀 Running Zealy scrape cycle...")
     try:
-        communities = discover_communities(limit=limit, requests_pages_try=3, save_compact=COMPACT_JSON_PATH)
-        if not communities:
+        raw_items = await _fetch_raw_communities(limit, requests_pages_try=3)
+        if not raw_items:
             logger.warning("No communities found in this scrape cycle")
             if ADMIN_ID:
                 await send_telegram_message(ADMIN_ID, "⚠️ No communities found in scrape cycle")
             return False
+        communities = _normalize_communities(raw_items, limit, skip_recent=True)
+        await _save_compact(COMPACT_JSON_PATH, communities)
+        if not communities:
+            # steady state: everything listed was already handled in the last 24h
+            logger.info(f"All {len(raw_items)} discovered communities were handled recently; nothing to do")
+            return 0
 
         logger.info(f"Found {len(communities)} communities to process (using discovery)")
 
-        # Prepare Playwright page once for quest fetching (if playwright available)
-        playwright_available = True
+        # one batched lookup for the whole cycle instead of per-community round-trips
+        links = [c['url'] for c in communities]
+        known = await asyncio.to_thread(known_links, links)
+        # None: the lookup failed. Fail safe (treat all as known, nothing is re-sent) but don't
+        # mark them recent, so the next cycle looks them up again
+        known_confirmed = known is not None
+        if known_confirmed:
+            await asyncio.to_thread(touch_last_seen, known)
+        else:
+            known = set(links)
+        fresh = [c for c in communities if c['url'] not in known]
+        # one Safe Browsing request for every new link instead of one per community
         try:
-            from playwright.async_api import async_playwright
-        except Exception:
-            playwright_available = False
-            logger.info("Playwright not available locally; quest fetching will use defaults")
-
-        page = None
-        browser = None
-        context = None
-        if playwright_available:
-            try:
-                p = await async_playwright().start()
-                browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-                context = await browser.new_context(user_agent=random.choice(USER_AGENTS))
-                page = await context.new_page()
-            except Exception as e:
-                logger.warning(f"Could not start Playwright for quests: {e}")
-                page = None
+            flagged = await asyncio.to_thread(check_scam_batch, [c['url'] for c in fresh])
+        except Exception as e:
+            logger.debug(f"Batched Safe Browsing lookup failed: {e}")
+            flagged = set()
 
-        for c in communities:
+        # Open a pool of pages on the shared browser context for quest fetching (if playwright available)
+        pages = []
+        try:
+            for _ in range(QUEST_PAGE_POOL):
+                pages.append(await _new_page())
+        except Exception as e:
+            if not pages:
+                logger.warning(f"Could not start Playwright for quests; quest fetching will use defaults: {e}")
+        page_queue: asyncio.Queue = asyncio.Queue()
+        for pg in pages:
+            page_queue.put_nowait(pg)
+        # one _Processed per community; saved + broadcast after the gather
+        results: List[_Processed] = []
+        # caps in-flight scam/Twitter lookups so a large cycle doesn't hammer those APIs
+        analyze_sem = asyncio.Semaphore(ANALYZE_CONCURRENCY)
+
+        async def _process(c):
             try:
-                if is_duplicate(c['url']) or was_sent_recently(c['url']):
+                if c['url'] in known:
                     logger.debug(f"Skipping duplicate/recent: {c['title']}")
-                    continue
+                    if known_confirmed:
+                        _mark_recent(c['slug'])
+                    return
 
                 # Get quests for scam analysis
                 sample_quests = []
-                if page:
+                if pages:
+                    page = await page_queue.get()
                     try:
                         sample_quests = await fetch_community_quests_with_page(page, c['slug'], limit=3)
                     except Exception as e:
                         logger.debug(f"Quest fetch error for {c['slug']}: {e}")
                         sample_quests = []
+                    finally:
+                        page_queue.put_nowait(page)
                 else:
                     # fallback default quests
                     sample_quests = [{
@@ -688,27 +1335,30 @@ async def run_scrape_once(limit=25):
 
                 sample_desc = "\n".join([f"{q['title']} ({q.get('xp','?')} XP)" for q in sample_quests])
 
-                # Run scam checks
-                scam_summary = run_scam_checks(c['title'], sample_desc, c['url'])
+                twitter_field = _twitter_field(c)
 
-                # Get Twitter buzz
-                twitter_score = 50
-                twitter_field = c.get('raw', {}).get('twitter') or c.get('raw', {}).get('twitter_handle') or c.get('raw', {}).get('twitterUrl') or c.get('raw', {}).get('twitter')
-                if twitter_field:
+                async def _buzz():
+                    if not twitter_field:
+                        return 50
                     try:
-                        twitter_score = rate_twitter_buzz(twitter_field)
+                        return await _cached_rate(twitter_field)
                     except Exception:
-                        twitter_score = 50
+                        return 50
+
+                # Scam checks and Twitter buzz are independent: run them together
+                # (blocking HTTP analyzers -> worker thread so other communities keep progressing)
+                async with analyze_sem:
+                    scam_summary, twitter_score = await asyncio.gather(
+                        asyncio.to_thread(run_scam_checks, c['title'], sample_desc, c['url']),
+                        _buzz()
+                    )
 
                 # Calculate XP (use max XP from quests)
                 xp_values = []
                 for q in sample_quests:
-                    xp_raw = q.get('xp')
-                    try:
-                        if xp_raw:
-                            xp_values.append(int(str(xp_raw).replace(',', '')))
-                    except Exception:
-                        continue
+                    xp_value = _parse_xp(q.get('xp'))
+                    if xp_value is not None:
+                        xp_values.append(xp_value)
                 xp_display = max(xp_values) if xp_values else "?"
 
                 # Calculate rank score
@@ -718,61 +1368,84 @@ async def run_scrape_once(limit=25):
                     xp_display if isinstance(xp_display, (int, float)) else 0
                 )
 
-                # Save record
-                save_airdrop_record(
+                # Prepare message (same template you used); scams are saved but never broadcast
+                if c['url'] in flagged:
+                    scam_summary['verdict'] = 'scam'
+                verdict = scam_summary.get('verdict', 'unknown')
+                message = None
+                if verdict == 'scam':
+                    logger.info(f"🚨 Scam detected: {c['title']}")
+                else:
+                    message = (
+                        f"🔥 *New Zealy Airdrop Found!*\\n\\n"
+                        f"*{c['title']}*\\n"
+                        f"XP: {xp_display}\\n"
+                        f"Rank: {rank_score}\\n"
+                        f"Verdict: {verdict}\\n\\n"
+                        f"Link: {c['url']}"
+                    )
+
+                # Saved in one bulk write after all communities are processed
+                results.append(_Processed(c, message, airdrop_upsert(
                     c['title'],
                     c['url'],
                     "zealy",
                     rank_score,
                     twitter_field,
                     xp_display,
-                    sample_desc
-                )
-
-                # Prepare and send message (same template you used)
-                verdict = scam_summary.get('verdict', 'unknown')
-                if verdict == 'scam':
-                    logger.info(f"🚨 Scam detected: {c['title']}")
-                    # Optionally still save but skip broadcast
-                    continue
-
-                message = (
-                    f"🔥 *New Zealy Airdrop Found!*\\n\\n"
-                    f"*{c['title']}*\\n"
-                    f"XP: {xp_display}\\n"
-                    f"Rank: {rank_score}\\n"
-                    f"Verdict: {verdict}\\n\\n"
-                    f"Link: {c['url']}"
-                )
-
-                await broadcast_to_all_users(message, skip_admin=True)
-                log_sent(c['url'])
-
-                logger.info(f"✅ Processed: {c['title']}")
-                # polite rate limiting between community processing
-                await asyncio.sleep(5)
+                    sample_desc,
+                    scam_summary=scam_summary,
+                    twitter_score=twitter_score
+                )))
             except Exception as e:
                 logger.error(f"Error processing community {c.get('title')}: {e}")
+
+        try:
+            # tweet links are rated in one /2/tweets?ids= call; _cached_rate then hits the cache
+            await _prime_tw_cache(_twitter_field(c) for c in fresh)
+            await asyncio.gather(*[_process(c) for c in communities])
+        finally:
+            # close only the pages; the shared browser stays alive for the next cycle
+            for pg in pages:
+                try:
+                    await pg.close()
+                except Exception:
+                    pass
+
+        # One round-trip for the whole cycle; only real inserts get broadcast
+        saved = await asyncio.to_thread(save_airdrop_records, [r.upsert for r in results])
+        if saved is None:
+            # nothing is known to be stored: leave the slugs unmarked so the next cycle retries them
+            return False
+        inserted, failed = saved
+        pending = []
+        for i, r in enumerate(results):
+            c = r.community
+            if i in failed:
                 continue
+            _mark_recent(c['slug'])
+            if i not in inserted:
+                logger.debug(f"Already stored, skipping broadcast: {c['title']}")
+            elif r.message:
+                pending.append((c['url'], r.message))
+                logger.info(f"✅ Processed: {c['title']}")
 
-        # cleanup playwright
-        if page:
-            try:
-                await page.close()
-            except Exception:
-                pass
-        if context:
-            try:
-                await context.close()
-            except Exception:
-                pass
-        if browser:
-            try:
-                await browser.close()
-            except Exception:
-                pass
+        # Flush broadcasts with bounded parallelism instead of a fixed 5s gap per community
+        broadcast_sem = asyncio.Semaphore(BROADCAST_CONCURRENCY)
 
-        return True
+        async def _send(url, message):
+            async with broadcast_sem:
+                await broadcast_to_all_users(message, skip_admin=True)
+                await asyncio.to_thread(log_sent, url)
+                # polite rate limiting per broadcast slot
+                await asyncio.sleep(1)
+
+        send_results = await asyncio.gather(*[_send(u, m) for u, m in pending], return_exceptions=True)
+        for (url, _), res in zip(pending, send_results):
+            if isinstance(res, Exception):
+                logger.error(f"Broadcast failed for {url}: {res}")
+
+        return len(pending)
 
     except Exception as e:
         logger.error(f"Scrape cycle failed: {e}")
@@ -781,6 +1454,21 @@ async def run_scrape_once(limit=25):
         return False
 
 # ---------------------- Daily trending ----------------------
+def _fetch_trending(cutoff, limit):
+    # scores were persisted at ingest time, so the digest is a pure sorted read
+    query = {"created_at": {"$gte": cutoff}, "processed": True, "scam_verdict": {"$ne": "scam"}}
+    try:
+        return list(
+            get_airdrops_col().find(query, TRENDING_PROJECTION)
+            .sort([("rank_score", -1)]).limit(limit).batch_size(limit).hint(TRENDING_INDEX)
+        )
+    except OperationFailure:
+        # index missing (creation failed at startup) -> same query without the hint
+        return list(
+            get_airdrops_col().find(query, TRENDING_PROJECTION)
+            .sort([("rank_score", -1)]).limit(limit).batch_size(limit)
+        )
+
 async def send_daily_trending(limit=12, send_to_admin=True):
     """
     Build and optionally send the daily trending digest.
@@ -788,44 +1476,20 @@ async def send_daily_trending(limit=12, send_to_admin=True):
     """
     try:
         cutoff = now_utc() - timedelta(hours=48)
-        records = list(airdrops_col.find({
-            "created_at": {"$gte": cutoff},
-            "processed": True
-        }).sort("rank_score", -1).limit(50))
+        records = await asyncio.to_thread(_fetch_trending, cutoff, limit)
 
         if not records:
             logger.info("No recent airdrops for daily trending")
             return None
 
-        scored = []
-        for r in records:
-            try:
-                scam_summary = run_scam_checks(r['title'], r.get('description', ''), r['link'])
-                twitter_score = rate_twitter_buzz(r.get('twitter', ''))
-                xp_value = int(r['xp']) if str(r['xp']).isdigit() else 0
-
-                scored.append((
-                    compute_rank_score(
-                        scam_summary.get("scam_score", 50),
-                        twitter_score,
-                        xp_value or 0
-                    ),
-                    r,
-                    xp_value or 0,
-                    scam_summary
-                ))
-            except Exception as e:
-                logger.error(f"Error scoring record {r.get('title')}: {e}")
-                continue
-
-        scored.sort(reverse=True, key=lambda x: x[0])
-
         # Build an attractive digest for users
         digest_lines = ["🔥 *Daily Top Trending Airdrops* 🔥", ""]
-        for i, (rank, c, xp, s) in enumerate(scored[:limit], 1):
+        for i, c in enumerate(records, 1):
             title = c.get('title', 'Unknown')[:80]
             link = c.get('link', '')
-            verdict = s.get('verdict', 'N/A') if s else 'N/A'
+            xp = _parse_xp(c.get('xp')) or 0
+            rank = c.get('rank_score')
+            verdict = c.get('scam_verdict') or 'N/A'
             digest_lines.append(f"{i}. *{title}* — XP: *{xp}* — Rank: *{rank}*\nLink: {link}\nVerdict: {verdict}\n")
 
         digest_lines.append("🔎 Tip: Check the most promising drops early. Stay safe and never share private keys.")
@@ -846,38 +1510,44 @@ async def send_daily_trending(limit=12, send_to_admin=True):
         return None
 
 # ---------------------- Runner / Scheduler ----------------------
-async def run_loop(poll_interval=POLL_INTERVAL, daily_hour=DAILY_HOUR_UTC):
-    logger.info("🚀 Zealy scraper started. Poll interval: %s seconds. Daily hour (UTC): %s", poll_interval, daily_hour)
-    last_daily_date = None
+async def run_loop(poll_interval=POLL_INTERVAL, daily_hour=DAILY_HOUR_UTC, max_interval=POLL_INTERVAL_MAX):
+    logger.info("🚀 Zealy scraper started. Poll interval: %s-%s seconds. Daily hour (UTC): %s", poll_interval, max_interval, daily_hour)
+    last_daily_bucket = 0  # hours since epoch of the last digest
+    cur_interval = poll_interval
     try:
         while True:
+            new_count = 0
             try:
-                await run_scrape_once(limit=25)
-                now = datetime.utcnow()
-                today_date = now.date()
-                if now.hour == daily_hour and (last_daily_date != today_date):
+                new_count = await run_scrape_once(limit=25) or 0
+                hour_bucket = int(time.time()) // 3600
+                if hour_bucket % 24 == daily_hour and hour_bucket != last_daily_bucket:
                     try:
                         await send_daily_trending(limit=12)
-                        last_daily_date = today_date
+                        last_daily_bucket = hour_bucket
                     except Exception as e:
                         logger.error(f"Daily trending failed: {e}")
             except Exception as e:
                 logger.exception("Main scrape error")
                 if ADMIN_ID:
                     await send_telegram_message(ADMIN_ID, f"[❌ Zealy main error] {str(e)[:200]}")
-            await asyncio.sleep(poll_interval)
+            # adaptive polling: back off while cycles come up empty, snap back on a hit
+            cur_interval = poll_interval if new_count > 0 else min(cur_interval * 2, max(max_interval, poll_interval))
+            await asyncio.sleep(cur_interval)
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
     except Exception as e:
         logger.exception("Critical error in main loop")
         if ADMIN_ID:
             await send_telegram_message(ADMIN_ID, f"[🚨 Critical Error] {str(e)[:200]}")
+    finally:
+        await close_playwright()
+        await close_telegram_session()
 
 # ---------------------- Test Function ----------------------
 async def test_scraper():
     logger.info("🧪 Testing Zealy scraper (discover + single quest fetch)...")
     try:
-        communities = discover_communities(limit=5, requests_pages_try=3, save_compact=None)
+        communities = await discover_communities_async(limit=5, requests_pages_try=3, save_compact=None)
         if not communities:
             logger.error("❌ No communities found!")
             if ADMIN_ID:
@@ -888,11 +1558,7 @@ async def test_scraper():
         # attempt one Playwright quest fetch
         page = None
         try:
-            from playwright.async_api import async_playwright
-            p = await async_playwright().start()
-            browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-            context = await browser.new_context(user_agent=random.choice(USER_AGENTS))
-            page = await context.new_page()
+            page = await _new_page()
         except Exception:
             page = None
 
@@ -924,10 +1590,9 @@ async def test_scraper():
         if page:
             try:
                 await page.close()
-                await context.close()
-                await browser.close()
             except Exception:
                 pass
+        await close_playwright()
 
         if ADMIN_ID and test_results:
             test_message = "🧪 *Zealy Scraper Test Results*\n\n" + "\n".join(test_results[:20])
@@ -938,10 +1603,11 @@ async def test_scraper():
         if ADMIN_ID:
             await send_telegram_message(ADMIN_ID, f"🧪 Test failed: {str(e)[:200]}")
         return False
+    finally:
+        await close_telegram_session()
 
 # ---------------------- Main ----------------------
 if __name__ == "__main__":
-    import sys
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         asyncio.run(test_scraper())
     else:
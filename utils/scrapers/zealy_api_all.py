@@ -3,98 +3,119 @@
 Fetch all Zealy communities by paging the public communities endpoint.
 
 Saves:
- - zealy_all_communities.json         (raw combined list)
+ - zealy_all_communities.json         (raw combined list; .json.zst when zstandard is installed)
  - zealy_all_communities_compact.json (compact slug/title/href list)
 
 Run:
   python utils/scrapers/zealy_api_all.py
 """
-from typing import Any, List
+from typing import Any
+from requests.adapters import HTTPAdapter
 import requests
-import time
-import json
+import asyncio
 import sys
+from pathlib import Path
+
+try:
+    from utils.scrapers._zealy_core import (
+        API_BASE as BASE, EXPLORE_URL, RETRY_ATTEMPTS, RETRY_STATUSES,
+        backoff_delay, find_items, iter_compact, loads, write_json, write_raw_json,
+    )
+except ImportError:  # run as a script: utils/scrapers is on sys.path
+    from _zealy_core import (
+        API_BASE as BASE, EXPLORE_URL, RETRY_ATTEMPTS, RETRY_STATUSES,
+        backoff_delay, find_items, iter_compact, loads, write_json, write_raw_json,
+    )
+
+try:
+    from utils.rate_limit import RateLimiter
+except ImportError:  # run as a script: put the repo root on sys.path (as utils/runner/run_once.py does)
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from utils.rate_limit import RateLimiter
 
-BASE = "https://api-v1.zealy.io/communities"
 OUT_RAW = "zealy_all_communities.json"
 OUT_COMPACT = "zealy_all_communities_compact.json"
 
 SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
 HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "User-Agent": "Mozilla/5.0 (compatible; ZealyAPIProbe/1.0)",
-    "Referer": "https://zealy.io/explore",
+    "Referer": EXPLORE_URL,
 }
 
 LIMIT = 30         # keep same as observed; increase if API supports larger values
 MAX_PAGES = 200    # safety cap to avoid infinite loops
-SLEEP_BETWEEN = 0.5
+WINDOW = 10        # pages fetched speculatively at once; anything past the first empty page is dropped
+RATE_PER_SEC = 4   # request starts per second across the whole window
 
 
 def fetch_page(page: int, limit: int = LIMIT) -> Any:
     params = {"category": "all", "page": page, "limit": limit}
     r = SESSION.get(BASE, headers=HEADERS, params=params, timeout=15)
     r.raise_for_status()
-    return r.json()
+    return loads(r.content)
 
 
-def find_items(obj: Any) -> List:
-    if isinstance(obj, list):
-        return obj
-    if isinstance(obj, dict):
-        for key in ("data", "communities", "items", "results"):
-            if key in obj and isinstance(obj[key], list):
-                return obj[key]
-        # fallback: first list value
-        for v in obj.values():
-            if isinstance(v, list):
-                return v
-    return []
-
-
-def normalize_item(it: dict):
-    slug = it.get("slug") or it.get("handle") or it.get("id") or it.get("community_id")
-    title = it.get("title") or it.get("name") or it.get("displayName") or it.get("label")
-    href = it.get("href") or it.get("url")
-    if not href and slug:
-        href = f"/c/{slug}"
-    return {"slug": slug, "title": title, "href": href, "raw": it}
+async def fetch_page_async(limiter: RateLimiter, page: int) -> Any:
+    # retry 429/5xx and connection trouble with jittered backoff; other errors end the crawl
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        await limiter.acquire()
+        try:
+            # requests is blocking; the window's pages share SESSION's pool from worker threads
+            return await asyncio.to_thread(fetch_page, page)
+        except requests.HTTPError as e:
+            resp = e.response
+            if resp is None or resp.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                raise
+            delay = backoff_delay(attempt, resp.headers.get("Retry-After"))
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == RETRY_ATTEMPTS:
+                raise
+            delay = backoff_delay(attempt)
+        print(f"Retrying page {page} in {delay:.1f}s (attempt {attempt + 1}/{RETRY_ATTEMPTS})", file=sys.stderr)
+        await asyncio.sleep(delay)
+
+
+async def fetch_all() -> list:
+    all_items = []
+    limiter = RateLimiter(RATE_PER_SEC)
+    for base in range(0, MAX_PAGES, WINDOW):
+        pages = range(base, min(base + WINDOW, MAX_PAGES))
+        results = await asyncio.gather(*(fetch_page_async(limiter, p) for p in pages), return_exceptions=True)
+
+        # pages are consumed in order, so the stop conditions are the same as a serial crawl
+        for page, data in zip(pages, results):
+            if isinstance(data, requests.HTTPError):
+                print(f"HTTP error fetching page {page}: {data}", file=sys.stderr)
+                return all_items
+            if isinstance(data, Exception):
+                print(f"Error fetching page {page}: {data}", file=sys.stderr)
+                return all_items
+
+            items = find_items(data)
+            n = len(items)
+            print(f"Fetched page {page}: {n} items")
+            if n == 0:
+                return all_items
+            all_items.extend(items)
+    return all_items
 
 
 def main():
-    all_items = []
-    for page in range(0, MAX_PAGES):
-        try:
-            data = fetch_page(page)
-        except requests.HTTPError as e:
-            print(f"HTTP error fetching page {page}: {e}", file=sys.stderr)
-            break
-        except Exception as e:
-            print(f"Error fetching page {page}: {e}", file=sys.stderr)
-            break
-
-        items = find_items(data)
-        n = len(items)
-        print(f"Fetched page {page}: {n} items")
-        if n == 0:
-            break
-        all_items.extend(items)
-        time.sleep(SLEEP_BETWEEN)
+    all_items = asyncio.run(fetch_all())
 
     # Save raw combined (best-effort)
     try:
-        with open(OUT_RAW, "w", encoding="utf-8") as f:
-            json.dump(all_items, f, indent=2, ensure_ascii=False)
-        print(f"Saved raw combined -> {OUT_RAW}")
+        out = write_raw_json(OUT_RAW, all_items)
+        print(f"Saved raw combined -> {out}")
     except Exception as e:
         print("Failed to save raw JSON:", e, file=sys.stderr)
 
-    normalized = [normalize_item(it if isinstance(it, dict) else {"raw": it}) for it in all_items]
-    compact = [{"slug": n["slug"], "title": n["title"], "href": n["href"]} for n in normalized]
+    compact = list(iter_compact(all_items))
 
     try:
-        with open(OUT_COMPACT, "w", encoding="utf-8") as f:
-            json.dump(compact, f, indent=2, ensure_ascii=False)
+        write_json(OUT_COMPACT, compact)
         print(f"Saved compact -> {OUT_COMPACT}")
     except Exception as e:
         print("Failed to save compact JSON:", e, file=sys.stderr)
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """
-Fetch all Zealy communities by calling the communities API from the browser context
-(using Playwright). This avoids the 403 that occurs when calling the API directly
-from requests.
+Fetch all Zealy communities by paging the communities API.
+
+Plain requests gets a 403, so the API is called with curl_cffi impersonating
+Chrome's TLS fingerprint; if that is refused too (or curl_cffi isn't installed)
+it falls back to calling the API from a Playwright browser context. The
+screenshot/HTML are only written on the browser path.
 
 Outputs:
- - zealy_browser_api_all_raw.json
+ - zealy_browser_api_all_raw.json (.json.zst when zstandard is installed)
  - zealy_browser_api_all_compact.json
  - zealy_browser_api_all.png
  - zealy_browser_api_all.html
@@ -14,78 +17,135 @@ Run:
   python utils/scrapers/zealy_api_via_browser_all.py
 """
 import asyncio
-import json
 import sys
-import time
-from typing import Any, Dict, List
 
-from playwright.async_api import async_playwright
+try:
+    from utils.scrapers._browser import browser_context, run_and_close
+except ImportError:  # run as a script: utils/scrapers is on sys.path
+    from _browser import browser_context, run_and_close
+
+try:
+    from utils.scrapers._zealy_core import (
+        API_BASE, BROWSER_FETCH_WINDOW_JS, EXPLORE_URL, RETRY_ATTEMPTS, RETRY_STATUSES,
+        backoff_delay, find_items, iter_compact, loads, page_url, write_json, write_raw_json,
+    )
+except ImportError:  # run as a script: utils/scrapers is on sys.path
+    from _zealy_core import (
+        API_BASE, BROWSER_FETCH_WINDOW_JS, EXPLORE_URL, RETRY_ATTEMPTS, RETRY_STATUSES,
+        backoff_delay, find_items, iter_compact, loads, page_url, write_json, write_raw_json,
+    )
+
+try:
+    from curl_cffi.requests import AsyncSession
+except ImportError:
+    AsyncSession = None  # optional: without it every run goes through the browser
 
-BASE = "https://api-v1.zealy.io/communities"
 OUT_RAW = "zealy_browser_api_all_raw.json"
 OUT_COMPACT = "zealy_browser_api_all_compact.json"
 SCREENSHOT = "zealy_browser_api_all.png"
 HTML = "zealy_browser_api_all.html"
 PAGE_LIMIT = 30
 MAX_PAGES = 200
-SLEEP_BETWEEN = 0.25  # safe pacing
-
-
-def find_items(obj: Any) -> List:
-    if isinstance(obj, list):
-        return obj
-    if isinstance(obj, dict):
-        for key in ("data", "communities", "items", "results"):
-            if key in obj and isinstance(obj[key], list):
-                return obj[key]
-        for v in obj.values():
-            if isinstance(v, list):
-                return v
-    return []
-
-
-def normalize_item(it: dict) -> Dict:
-    slug = it.get("slug") or it.get("handle") or it.get("id") or it.get("community_id")
-    title = it.get("title") or it.get("name") or it.get("displayName") or it.get("label")
-    href = it.get("href") or it.get("url")
-    if not href and slug:
-        href = f"/c/{slug}"
-    return {"slug": slug, "title": title, "href": href, "raw": it}
-
-
-async def fetch_page_from_browser(page, page_num: int, limit: int = PAGE_LIMIT):
-    url = f"{BASE}?category=all&page={page_num}&limit={limit}"
-    # run fetch from page context so request uses browser headers/origin
-    result = await page.evaluate(
-        """async (url) => {
-            try {
-                const res = await fetch(url, { method: 'GET', credentials: 'omit', headers: { 'Accept': 'application/json, text/plain, */*' } });
-                const status = res.status;
-                let json = null;
-                try { json = await res.json(); } catch(e) { json = null; }
-                return { status, json };
-            } catch (err) {
-                return { error: String(err) };
-            }
-        }""",
-        url,
+WINDOW = 10  # pages fetched together per window; anything past the first empty page is dropped
+
+# direct (curl_cffi) path: Chrome's TLS fingerprint plus the headers the explore page would send
+HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Referer": EXPLORE_URL,
+}
+
+
+async def fetch_window_from_browser(page, base: int, count: int, limit: int = PAGE_LIMIT):
+    # run the fetches from page context so requests use browser headers/origin
+    return await page.evaluate(
+        BROWSER_FETCH_WINDOW_JS, {"api": API_BASE, "base": base, "count": count, "limit": limit}
     )
-    return result
 
 
-async def main():
+async def fetch_window_direct(session, base: int, count: int, limit: int = PAGE_LIMIT):
+    # same result shape as BROWSER_FETCH_WINDOW_JS so crawl() handles both paths
+    async def one(page_num):
+        try:
+            r = await session.get(page_url(page_num, limit))
+        except Exception as e:
+            return {"error": str(e)}
+        try:
+            body = loads(r.content)
+        except Exception:
+            body = None
+        return {"status": r.status_code, "json": body, "retryAfter": r.headers.get("Retry-After")}
+
+    return await asyncio.gather(*(one(base + i) for i in range(count)))
+
+
+async def crawl(fetch_window, label: str):
+    """
+    Page the API a window at a time until an error, non-200 or empty page.
+    Returns (items, pages fetched, status of the first page, None if it errored) so
+    crawl_direct() can tell a refused client from an empty listing.
+    """
     all_items = []
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
-            locale="en-US",
+    page_num = 0
+    first_status = None
+    for base in range(0, MAX_PAGES, WINDOW):
+        count = min(WINDOW, MAX_PAGES - base)
+        print(f"{label} pages {base}-{base + count - 1} ...")
+        results = await fetch_window(base, count)
+        # consume in page order so the stop conditions match a serial crawl
+        for result in results:
+            # a failed page is re-fetched on its own (jittered backoff) before it can end the crawl
+            attempt = 1
+            while attempt < RETRY_ATTEMPTS and ("error" in result or result.get("status") in RETRY_STATUSES):
+                delay = backoff_delay(attempt, result.get("retryAfter"))
+                print(f"Retrying page {page_num} in {delay:.1f}s (attempt {attempt + 1}/{RETRY_ATTEMPTS})", file=sys.stderr)
+                await asyncio.sleep(delay)
+                result = (await fetch_window(page_num, 1))[0]
+                attempt += 1
+            if "error" in result:
+                print(f"ERROR ({label}):", result["error"], file=sys.stderr)
+                return all_items, page_num, first_status
+            status = result.get("status")
+            if first_status is None:
+                first_status = status
+            json_body = result.get("json")
+            if status != 200:
+                print(f"Non-200 status for page {page_num}: {status}", file=sys.stderr)
+                return all_items, page_num, first_status
+            items = find_items(json_body) if json_body is not None else []
+            print(f"Fetched page {page_num}: {len(items)} items")
+            if not items:
+                return all_items, page_num, first_status
+            all_items.extend(items)
+            page_num += 1
+    return all_items, page_num, first_status
+
+
+async def crawl_direct():
+    """Page the API over curl_cffi with Chrome's TLS fingerprint; None if unavailable or refused."""
+    if AsyncSession is None:
+        return None
+    async with AsyncSession(impersonate="chrome120", headers=HEADERS, timeout=15) as session:
+        all_items, page_num, first_status = await crawl(
+            lambda base, count: fetch_window_direct(session, base, count), "Direct-fetch"
         )
+    if page_num == 0 and first_status != 200:
+        # 403 from the bot check (or no answer at all): let the real browser try
+        print(f"Direct fetch refused ({first_status}); falling back to the browser", file=sys.stderr)
+        return None
+    return all_items, page_num
+
+
+async def crawl_via_browser():
+    async with browser_context(
+        block_resources=True,
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+        locale="en-US",
+    ) as context:
         page = await context.new_page()
 
         # visit explore page first to ensure any site-side state is set
         try:
-            await page.goto("https://zealy.io/explore", wait_until="networkidle", timeout=30000)
+            await page.goto(EXPLORE_URL, wait_until="domcontentloaded", timeout=30000)
         except Exception:
             # continue even if the navigation warning occurs
             pass
@@ -102,43 +162,29 @@ async def main():
         except Exception:
             pass
 
-        page_num = 0
-        for i in range(MAX_PAGES):
-            print(f"Browser-fetch page {page_num} ...")
-            result = await fetch_page_from_browser(page, page_num)
-            if "error" in result:
-                print("ERROR (browser fetch):", result["error"], file=sys.stderr)
-                break
-            status = result.get("status")
-            json_body = result.get("json")
-            if status != 200:
-                print(f"Non-200 status for page {page_num}: {status}", file=sys.stderr)
-                break
-            items = find_items(json_body) if json_body is not None else []
-            print(f"Fetched page {page_num}: {len(items)} items")
-            if not items:
-                break
-            all_items.extend(items)
-            page_num += 1
-            # optional small delay between page fetches
-            time.sleep(SLEEP_BETWEEN)
+        all_items, page_num, _ = await crawl(
+            lambda base, count: fetch_window_from_browser(page, base, count), "Browser-fetch"
+        )
+    return all_items, page_num
 
-        await browser.close()
+
+async def main():
+    result = await crawl_direct()
+    if result is None:
+        result = await crawl_via_browser()
+    all_items, page_num = result
 
     # Save raw combined
     try:
-        with open(OUT_RAW, "w", encoding="utf-8") as f:
-            json.dump({"fetchedPages": page_num, "items": all_items}, f, indent=2, ensure_ascii=False)
-        print(f"Saved raw combined -> {OUT_RAW}")
+        out = write_raw_json(OUT_RAW, {"fetchedPages": page_num, "items": all_items})
+        print(f"Saved raw combined -> {out}")
     except Exception as e:
         print("Warning: failed to save raw JSON:", e, file=sys.stderr)
 
-    normalized = [normalize_item(it if isinstance(it, dict) else {"raw": it}) for it in all_items]
-    compact = [{"slug": n["slug"], "title": n["title"], "href": n["href"]} for n in normalized]
+    compact = list(iter_compact(all_items))
 
     try:
-        with open(OUT_COMPACT, "w", encoding="utf-8") as f:
-            json.dump(compact, f, indent=2, ensure_ascii=False)
+        write_json(OUT_COMPACT, compact)
         print(f"Saved compact -> {OUT_COMPACT}")
     except Exception as e:
         print("Warning: failed to save compact JSON:", e, file=sys.stderr)
@@ -149,4 +195,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close(main()))
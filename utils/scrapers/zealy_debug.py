@@ -1,8 +1,17 @@
 import asyncio
 import random
 import logging
+from itertools import islice
 from pathlib import Path
-from playwright.async_api import async_playwright
+try:
+    from utils.scrapers._browser import browser_context, run_and_close
+except ImportError:  # run as a script: utils/scrapers is on sys.path
+    from _browser import browser_context, run_and_close
+
+try:
+    from utils.scrapers._zealy_core import ANCHORS_JS, COMMUNITY_ANCHOR_SELECTOR, LXML_AVAILABLE, iter_community_anchors
+except ImportError:  # run as a script: utils/scrapers is on sys.path
+    from _zealy_core import ANCHORS_JS, COMMUNITY_ANCHOR_SELECTOR, LXML_AVAILABLE, iter_community_anchors
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -19,12 +28,10 @@ async def main():
     url = "https://zealy.io/explore"
     network_logs = []
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-        context = await browser.new_context(
-            user_agent=random.choice(USER_AGENTS),
-            viewport={"width": 1400, "height": 900}
-        )
+    async with browser_context(
+        user_agent=random.choice(USER_AGENTS),
+        viewport={"width": 1400, "height": 900}
+    ) as context:
 
         try:
             await context.add_init_script(
@@ -75,6 +82,7 @@ async def main():
         except Exception as e:
             logger.warning(f"Could not save screenshot: {e}")
 
+        html = None
         try:
             html = await page.content()
             html_path = OUT_DIR / "zealy_debug.html"
@@ -83,19 +91,24 @@ async def main():
         except Exception as e:
             logger.warning(f"Could not save HTML: {e}")
 
-        anchors = await page.query_selector_all("a[href*='/c/']")
-        found = []
-        for a in anchors[:200]:
+        if html is not None and LXML_AVAILABLE:
+            # parse the HTML already captured above instead of two CDP round-trips per anchor
+            anchors = list(islice(iter_community_anchors(html), 200))
+        else:
             try:
-                href = await a.get_attribute("href")
-                if not href:
-                    continue
-                slug = href.split("/c/")[-1].split("/")[0].split("?")[0].split("#")[0]
-                if slug and len(slug) > 1:
-                    title = (await a.text_content()) or ""
-                    found.append({"href": href, "slug": slug, "title": title.strip()[:80]})
+                anchors = await page.eval_on_selector_all(COMMUNITY_ANCHOR_SELECTOR, ANCHORS_JS, 200)
             except Exception:
+                anchors = []
+        found = []
+        seen = set()
+        for href, title in anchors:
+            # each card links its community several times (logo, title, card body)
+            if href in seen:
                 continue
+            seen.add(href)
+            slug = href.split("/c/")[-1].split("/")[0].split("?")[0].split("#")[0]
+            if slug and len(slug) > 1:
+                found.append({"href": href, "slug": slug, "title": (title or "").strip()[:80]})
 
         try:
             net_path = OUT_DIR / "zealy_network.log"
@@ -108,7 +121,5 @@ async def main():
         for i, item in enumerate(found[:20], start=1):
             logger.info(f"{i}. slug='{item['slug']}' title='{item['title']}' href='{item['href']}'")
 
-        await browser.close()
-
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close(main()))
@@ -1,6 +1,18 @@
-from database.db import get_all_users
+import asyncio
+
+from database.db import get_all_users, remove_user
+from utils.rate_limit import RateLimiter
 from utils.scam_filter import basic_scam_check  # ✅ Fixed import
-from aiogram.exceptions import TelegramForbiddenError as BotBlocked
+from aiogram.exceptions import TelegramForbiddenError as BotBlocked, TelegramRetryAfter
+
+# Sends in flight at once; the limiter below is what keeps us under Telegram's limit
+SEND_CONCURRENCY = 25
+SEND_RATE_PER_SEC = 30   # Telegram's global bot limit
+MAX_SEND_ATTEMPTS = 3    # per user, counting retries after a 429
+
+
+# one bucket for every broadcast; pause() after a 429 (flood limits are per bot, not per chat)
+limiter = RateLimiter(SEND_RATE_PER_SEC)
 
 # ✅ Format the airdrop message (kept for fallback/manual sends)
 def format_airdrop(title, description, link, project):
@@ -32,17 +44,34 @@ async def send_airdrop_to_all(bot, title, description, link, project, preformatt
         msg = format_airdrop(title, description, link, project)
 
     # Broadcast
-    users = await get_all_users()
-    for user_id in users:
-        try:
-            await bot.send_message(
-                chat_id=user_id,
-                text=msg,
-                parse_mode="Markdown",
-                disable_web_page_preview=True
-            )
-        except BotBlocked:
-            continue
-        except Exception as e:
-            print(f"❌ Failed to send to {user_id}: {e}")
-            continue
+    users = await asyncio.to_thread(get_all_users)
+    sem = asyncio.Semaphore(SEND_CONCURRENCY)
+
+    async def send_one(user_id, attempt=1):
+        async with sem:
+            await limiter.acquire()
+            try:
+                await bot.send_message(
+                    chat_id=user_id,
+                    text=msg,
+                    parse_mode="Markdown",
+                    disable_web_page_preview=True
+                )
+                return
+            except BotBlocked:
+                # user blocked the bot: drop them so later broadcasts skip the dead chat
+                await asyncio.to_thread(remove_user, user_id)
+                return
+            except TelegramRetryAfter as e:
+                # hold every sender, not just this one, until Telegram lets us back in
+                limiter.pause(e.retry_after + 0.1)
+                if attempt >= MAX_SEND_ATTEMPTS:
+                    print(f"❌ Gave up on {user_id} after {attempt} rate-limited attempts")
+                    return
+            except Exception as e:
+                print(f"❌ Failed to send to {user_id}: {e}")
+                return
+        # requeue outside the semaphore; acquire() waits out the pause
+        await send_one(user_id, attempt + 1)
+
+    await asyncio.gather(*(send_one(u) for u in users), return_exceptions=True)
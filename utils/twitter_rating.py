@@ -1,47 +1,107 @@
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional: falls back to requests' stdlib json
+
 BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN")
 
+# One pooled session for every lookup: repeat calls skip the TCP+TLS handshake
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+API_BASE = "https://api.twitter.com/2/tweets"
+BATCH_SIZE = 100  # most ids /2/tweets accepts per request
+
+def _tweet_id(tweet_url):
+    return tweet_url.split("/")[-1].split("?")[0]
+
+def _json(response):
+    return orjson.loads(response.content) if orjson is not None else response.json()
+
+def _buzz_label(metrics):
+    likes = metrics.get("like_count", 0)
+    retweets = metrics.get("retweet_count", 0)
+    replies = metrics.get("reply_count", 0)
+
+    # Simple score (you can tweak this)
+    score = likes + (retweets * 2) + replies
+
+    # Rating level
+    if score > 2000:
+        level = "🔥 Viral"
+    elif score > 500:
+        level = "🚀 Trending"
+    elif score > 100:
+        level = "🌟 Active"
+    else:
+        level = "🧊 Low Buzz"
+
+    return f"{level} ({score} buzz score)"
+
+# returned when a tweet couldn't be rated (missing metrics, API/network error); callers
+# that cache ratings should not cache this one
+RATING_UNAVAILABLE = "⚠️ Rating unavailable"
+
 def rate_twitter_buzz(tweet_url):
     try:
         # Extract tweet ID from URL
-        tweet_id = tweet_url.split("/")[-1].split("?")[0]
+        tweet_id = _tweet_id(tweet_url)
 
         # Twitter API v2 endpoint
-        url = f"https://api.twitter.com/2/tweets/{tweet_id}?tweet.fields=public_metrics"
+        url = f"{API_BASE}/{tweet_id}?tweet.fields=public_metrics"
 
         headers = {
             "Authorization": f"Bearer {BEARER_TOKEN}"
         }
 
-        response = requests.get(url, headers=headers)
-        data = response.json()
+        response = SESSION.get(url, headers=headers)
+        data = _json(response)
 
         if "data" not in data or "public_metrics" not in data["data"]:
-            return "⚠️ Rating unavailable"
+            return RATING_UNAVAILABLE
 
-        metrics = data["data"]["public_metrics"]
-        likes = metrics.get("like_count", 0)
-        retweets = metrics.get("retweet_count", 0)
-        replies = metrics.get("reply_count", 0)
+        return _buzz_label(data["data"]["public_metrics"])
 
-        # Simple score (you can tweak this)
-        score = likes + (retweets * 2) + replies
+    except Exception as e:
+        logging.error(f"Twitter rating error: {e}")
+        return RATING_UNAVAILABLE
 
-        # Rating level
-        if score > 2000:
-            level = "🔥 Viral"
-        elif score > 500:
-            level = "🚀 Trending"
-        elif score > 100:
-            level = "🌟 Active"
-        else:
-            level = "🧊 Low Buzz"
+def rate_twitter_buzz_batch(tweet_urls):
+    """
+    Rate many tweets with one /2/tweets?ids= request per 100 ids.
+    Returns {tweet_url: rating}; urls whose tweet couldn't be rated are left out.
+    """
+    by_id = {}
+    for tweet_url in tweet_urls:
+        tweet_id = _tweet_id(tweet_url)
+        if tweet_id.isdigit():
+            by_id.setdefault(tweet_id, []).append(tweet_url)
 
-        return f"{level} ({score} buzz score)"
+    ids = list(by_id)
+    headers = {"Authorization": f"Bearer {BEARER_TOKEN}"}
+    ratings = {}
+    for i in range(0, len(ids), BATCH_SIZE):
+        try:
+            response = SESSION.get(
+                API_BASE,
+                params={"ids": ",".join(ids[i:i + BATCH_SIZE]), "tweet.fields": "public_metrics"},
+                headers=headers,
+            )
+            data = _json(response)
+        except Exception as e:
+            logging.error(f"Twitter batch rating error: {e}")
+            continue
 
-    except Exception as e:
-        logging.error(f"Twitter rating error: {e}")
-        return "⚠️ Rating unavailable"
+        for tweet in data.get("data") or []:
+            if "public_metrics" not in tweet:
+                continue
+            label = _buzz_label(tweet["public_metrics"])
+            for tweet_url in by_id.get(tweet.get("id"), []):
+                ratings[tweet_url] = label
+
+    return ratings
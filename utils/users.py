@@ -1,5 +1,6 @@
 # utils/users.py
 from datetime import datetime
+from functools import lru_cache
 from pymongo import MongoClient
 import os
 from dotenv import load_dotenv
@@ -8,24 +9,30 @@ from dotenv import load_dotenv
 load_dotenv()
 MONGO_URI = os.getenv("MONGO_URI")
 
-client = MongoClient(MONGO_URI)
-db = client["zkdrop_bot"]   # your database name
-users_col = db["users"]     # collection for users
+@lru_cache(maxsize=1)
+def get_users_col():
+    """Connect on first use instead of at import"""
+    client = MongoClient(MONGO_URI, compressors="zstd,zlib")
+    db = client["zkdrop_bot"]   # your database name
+    return db["users"]          # collection for users
 
 def save_user(user_id: int, username: str, first_name: str):
     """Save user if not already saved"""
-    if not users_col.find_one({"user_id": user_id}):
-        users_col.insert_one({
+    get_users_col().update_one(
+        {"user_id": user_id},
+        {"$setOnInsert": {
             "user_id": user_id,
             "username": username,
             "first_name": first_name,
             "joined_at": datetime.utcnow()
-        })
+        }},
+        upsert=True
+    )
 
 def get_all_users():
     """Return all users in DB"""
-    return list(users_col.find({}))
+    return list(get_users_col().find({}))
 
 def remove_user(user_id: int):
     """Remove user if they block the bot"""
-    users_col.delete_one({"user_id": user_id})
+    get_users_col().delete_one({"user_id": user_id})